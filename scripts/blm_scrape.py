@@ -3,11 +3,25 @@ BLM ePlanning public-comment finder (Colorado-only)
 
 What this does (in plain English):
 - Opens the BLM ePlanning search UI with a Colorado filter applied.
-- Scrolls the results to trigger lazy-loading and harvests project IDs from links.
+- Scrolls the results to trigger lazy-loading (until no new project links show up)
+  and harvests project IDs from links.
 - For each project, visits a handful of tabs (510, 570, 565, 5101), grabs the page text,
-  and looks for anything that reads like "public comment".
+  and looks for anything that reads like "public comment". Once a tab gives us public
+  comment language *and* a date, the remaining tabs are skipped.
 - If we see public comment language, we try to pull out a date and a state,
   and we optionally ask the BLM ArcGIS service for a lat/lon.
+- Project tabs are crawled by a small pool of browser pages in parallel (async Playwright),
+  with a per-host rate limit so we stay polite to ePlanning.
+- Plain HTTP calls (JSON API, ArcGIS) go through the shared on-disk cache in
+  http_cache.py, so unchanged responses cost a 304 or nothing on re-runs.
+  Browser-rendered tabs are not HTTP-cacheable and are always re-rendered.
+- With `--engine api` we skip the browser and read the same data from the JSON
+  endpoints the ePlanning SPA calls, falling back to Playwright only for projects
+  the API can't resolve.
+- Crawls are incremental: a small state file remembers each project's listing and
+  content fingerprints, so only new, changed, or stale projects get re-visited.
+- Each finished project is appended to a durable journal as we go, so a crash or network
+  blip mid-crawl resumes where it left off instead of starting over.
 - Finally, we write a light CSV with the bits we care about so the rest of the pipeline
   can pick it up.
 
@@ -17,52 +31,220 @@ Notes & guardrails:
 - If ArcGIS gives us a coordinate, we trust it; otherwise we leave lat/lon blank.
 """
 
+import os
 import re
 import csv
 import json
-import requests
-from datetime import datetime
-from playwright.sync_api import sync_playwright
+import hashlib
+import tempfile
+import time
+import asyncio
+import argparse
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+try:  # imported as part of the scripts package (e.g. from tests)
+    from .date_extract import LONG, MDY, find_dates
+    from .http_cache import default_cache, make_session
+except ImportError:  # run directly as `python scripts/<name>.py`
+    from date_extract import LONG, MDY, find_dates
+    from http_cache import default_cache, make_session
+
+# Project tabs that tend to carry overview text and comment notices, in the order we
+# scan them. Scanning stops early once a tab gives us "public comment" plus a date.
+PROJECT_TABS = ("510", "570", "565", "5101")
+PROJECT_URL = "https://eplanning.blm.gov/eplanning-ui/project/{pid}/{tab}"
+
+# Crawl defaults: how many browser pages run at once, and how many page loads
+# per second we allow against a single host.
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 4.0
+
+# Colorado filter used by both the search UI and its backing JSON API.
+SEARCH_FILTER = {
+    "states": ["CO"], "offices": None, "projectTypes": None, "programs": None,
+    "years": None, "open": False, "active": True,
+}
+SEARCH_UI_URL = "https://eplanning.blm.gov/eplanning-ui/search?filterSearch="
+
+# JSON backend the ePlanning SPA talks to. The `--engine api` path calls these directly.
+EPLANNING_API = "https://eplanning.blm.gov/eplanning-ws/epl"
+API_SEARCH_URL = EPLANNING_API + "/site/search"
+API_PROJECT_URL = EPLANNING_API + "/project/{pid}"
+API_PAGE_SIZE = 100
+API_TIMEOUT = 30
+API_HEADERS = {"Accept": "application/json"}
+
+# BLM ePlanning project-location layer (X_match/Y_match hold lon/lat).
+ARCGIS_LAYER = "https://eplanning.blm.gov/arcgisfed/rest/services/Proj_Loc_FO/BLM_ePlan_Proj_Loc/MapServer/4"
+ARCGIS_DEFAULT_MAX_RECORDS = 1000
+
+# Incremental crawl state: project ID -> fingerprints + timestamps (+ last record).
+CRAWL_STATE_PATH = "data/state/blm_crawl_state.json"
+STALE_AFTER_DAYS = 7   # re-visit unchanged projects at least this often
+
+# Append-only checkpoint of projects finished in the current crawl (cleared on success).
+JOURNAL_PATH = "data/state/blm_crawl.journal.jsonl"
+JOURNAL_MAX_AGE_HOURS = 24  # older checkpoints are re-fetched rather than trusted
+
+# Readiness tuning (milliseconds unless noted). Instead of sleeping a fixed amount after
+# every navigation, we wait on real signals and give up after these timeouts.
+NETWORK_IDLE_TIMEOUT_MS = 3000   # cap on waiting for the SPA's XHRs to settle
+READY_TIMEOUT_MS = 10000         # cap on waiting for a selector / stable DOM
+STABLE_POLL_MS = 150             # how often we re-measure the DOM
+STABLE_POLLS = 2                 # consecutive unchanged measurements = "rendered"
+
+# Search results lazy-load as you scroll; we stop once scrolling stops adding links.
+PROJECT_ANCHOR_SELECTOR = "a[href*='/eplanning-ui/project/']"
+SCROLL_GROW_TIMEOUT_MS = 2500    # how long one scroll may take to reveal new rows
+SCROLL_IDLE_ROUNDS = 2           # scrolls in a row with no new rows before we stop
+MAX_SCROLLS = 200                # hard stop, just in case the list never ends
+
+# Resolves true once the body text has been non-empty and unchanged for `polls` checks.
+# State lives on window, so it resets naturally with every navigation.
+_STABLE_DOM_JS = """
+(polls) => {
+  const n = document.body ? document.body.innerText.length : 0;
+  const s = window.__stableProbe || (window.__stableProbe = {len: -1, same: 0});
+  if (n > 0 && n === s.len) { s.same += 1; } else { s.len = n; s.same = 0; }
+  return s.same >= polls;
+}
+"""
 
+_ANCHOR_GROWTH_JS = "([sel, n]) => document.querySelectorAll(sel).length > n"
 
-def discover_ids():
+
+def wait_until_ready(page, selector=None, timeout=READY_TIMEOUT_MS):
+    """
+    Wait for a page to be "done enough" to read, without a fixed sleep.
+
+    Signals, in order:
+    - network idle (short cap — some SPAs never go fully quiet),
+    - an optional selector that marks the content we care about,
+    - a stable DOM (body text stops changing between polls).
+
+    Args:
+        page: Playwright sync Page.
+        selector (str | None): CSS selector that must appear before we read.
+        timeout (int): Max ms for the selector and stable-DOM waits.
+
+    Returns:
+        bool: True if every signal was seen, False if we timed out (callers still
+        read whatever rendered — a slow page beats an empty row).
+    """
+    try:
+        page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        pass
+    try:
+        if selector:
+            page.wait_for_selector(selector, timeout=timeout)
+        page.wait_for_function(_STABLE_DOM_JS, arg=STABLE_POLLS, polling=STABLE_POLL_MS, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_until_ready_async(page, selector=None, timeout=READY_TIMEOUT_MS):
+    """
+    Async twin of wait_until_ready() for the concurrent crawler.
+    """
+    try:
+        await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        pass
+    try:
+        if selector:
+            await page.wait_for_selector(selector, timeout=timeout)
+        await page.wait_for_function(_STABLE_DOM_JS, arg=STABLE_POLLS, polling=STABLE_POLL_MS, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+def scroll_until_exhausted(page, selector=PROJECT_ANCHOR_SELECTOR):
+    """
+    Keep scrolling a lazy-loading list until new matching anchors stop appearing.
+
+    Each scroll waits only as long as it takes for the anchor count to grow; if it
+    doesn't grow within SCROLL_GROW_TIMEOUT_MS for SCROLL_IDLE_ROUNDS scrolls in a
+    row, we assume we've hit the bottom.
+
+    Returns:
+        int: Number of matching anchors on the page when we stopped.
+    """
+    count = page.locator(selector).count()
+    idle = 0
+    for _ in range(MAX_SCROLLS):
+        page.mouse.wheel(0, 2000)
+        try:
+            page.wait_for_function(_ANCHOR_GROWTH_JS, arg=[selector, count], timeout=SCROLL_GROW_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            idle += 1
+            if idle >= SCROLL_IDLE_ROUNDS:
+                break
+            continue
+        idle = 0
+        count = page.locator(selector).count()
+    return count
+
+
+def discover_listings():
     """
-    Walk the ePlanning UI search page (Colorado filter) and collect project IDs.
+    Walk the ePlanning UI search page (Colorado filter) and collect project IDs
+    along with the text of their result rows.
 
     Approach:
     - Load the search page with a prebuilt JSON filter in the query string.
-    - Scroll a few times to trigger lazy-loading of more results.
-    - Scrape all <a> anchors and regex out /project/<ID> patterns.
+    - Wait for the first result links, then scroll until no new ones appear.
+    - Scrape the project anchors, regex out /project/<ID>, and keep the enclosing
+      result row's text (title, status, dates) as the project's listing metadata.
 
     Returns:
-        list[str]: Sorted list of project IDs (strings like "123456").
+        dict[str, str]: Project ID -> listing text.
     """
-    url = "https://eplanning.blm.gov/eplanning-ui/search?filterSearch=" + \
-          '{"states":["CO"],"offices":null,"projectTypes":null,"programs":null,"years":null,"open":false,"active":true}'
+    url = SEARCH_UI_URL + json.dumps(SEARCH_FILTER, separators=(",", ":"))
 
-    ids = set()
+    listings = {}
 
     # Playwright does the heavy lifting here because the page is JS-driven.
     with sync_playwright() as p:
         browser = p.chromium.launch()
         page = browser.new_page()
         page.goto(url)
-
-        # Gentle scrolling: we nudge the page a few times and give it a beat to load more rows.
-        for _ in range(10):
-            page.mouse.wheel(0, 2000)
-            page.wait_for_timeout(800)
-
-        # Grab every anchor href on the page and look for /eplanning-ui/project/<digits>
-        hrefs = page.eval_on_selector_all("a", "els => els.map(e => e.href)")
-        for h in hrefs:
-            m = re.search(r"/eplanning-ui/project/(\d{6,})", h)
+        wait_until_ready(page, selector=PROJECT_ANCHOR_SELECTOR)
+
+        # Scroll until the lazy-loaded list stops growing (fast lists finish quickly,
+        # slow ones get as many scrolls as they need).
+        n_links = scroll_until_exhausted(page)
+        print(f"[INFO] Search list settled at {n_links} project links")
+
+        # Grab each project anchor's href plus its result row's text.
+        rows = page.eval_on_selector_all(
+            PROJECT_ANCHOR_SELECTOR,
+            "els => els.map(e => [e.href, (e.closest('tr, li, [role=row], mat-row') || e).innerText])",
+        )
+        for href, text in rows:
+            m = re.search(r"/eplanning-ui/project/(\d{6,})", href)
             if m:
-                ids.add(m.group(1))
+                pid = m.group(1)
+                listings[pid] = (listings.get(pid, "") + "\n" + (text or "")).strip()
 
         browser.close()
 
-    return sorted(ids)
+    return listings
+
+
+def discover_ids():
+    """
+    Collect Colorado project IDs from the search UI (see discover_listings()).
+
+    Returns:
+        list[str]: Sorted list of project IDs (strings like "123456").
+    """
+    return sorted(discover_listings())
 
 
 def extract_date(text):
@@ -81,24 +263,10 @@ def extract_date(text):
     Returns:
         str | None: ISO date string if found, else None.
     """
-    patterns = [
-        r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}\b",
-        r"\b\d{1,2}/\d{1,2}/\d{4}\b"
-    ]
-    for pat in patterns:
-        match = re.search(pat, text)
-        if match:
-            raw = match.group(0)
-            # Try Month DD, YYYY
-            try:
-                return datetime.strptime(raw, "%B %d, %Y").date().isoformat()
-            except ValueError:
-                # Fall back to MM/DD/YYYY
-                try:
-                    return datetime.strptime(raw, "%m/%d/%Y").date().isoformat()
-                except ValueError:
-                    continue
-    return None
+    # One pass over the text; long form wins over numeric, as before.
+    matches = find_dates(text, kinds=(LONG, MDY))
+    best = next((m for m in matches if m.kind == LONG), None) or next(iter(matches), None)
+    return best.date.isoformat() if best else None
 
 
 def extract_state(text):
@@ -118,49 +286,282 @@ def extract_state(text):
     return "Colorado"
 
 
-def query_arcgis_for_lat_lon(pid):
+def _arcgis_max_records(session):
+    """
+    Read the layer's maxRecordCount so each batch fits in one response.
+    """
+    try:
+        r = default_cache().get(ARCGIS_LAYER, params={"f": "json"}, session=session, timeout=API_TIMEOUT)
+        r.raise_for_status()
+        return int(r.json().get("maxRecordCount") or ARCGIS_DEFAULT_MAX_RECORDS)
+    except Exception as e:
+        print(f"[WARN] Could not read ArcGIS layer info, assuming {ARCGIS_DEFAULT_MAX_RECORDS}: {e}")
+        return ARCGIS_DEFAULT_MAX_RECORDS
+
+
+def query_arcgis_locations(pids, session=None):
     """
-    Ask the BLM ArcGIS service if it knows the lat/lon for this project.
+    Ask the BLM ArcGIS service for lat/lon of many projects at once.
 
     Endpoint:
         https://eplanning.blm.gov/arcgisfed/rest/services/Proj_Loc_FO/BLM_ePlan_Proj_Loc/MapServer/4/query
 
     Strategy:
-    - Query where projectID=<pid>, pull the first feature's attributes.
-    - If X_match/Y_match are present, treat them as lon/lat.
+    - Split IDs into batches of the layer's maxRecordCount.
+    - Query where projectID IN (...) per batch (POST, so long ID lists don't blow URL limits).
+    - Keep the first feature per project; X_match/Y_match are lon/lat.
 
     Args:
-        pid (str): Project ID.
+        pids (list[str]): Project IDs.
+        session (requests.Session | None): Shared session; one is made if omitted.
+
+    Returns:
+        dict[str, tuple[float, float]]: pid -> (lat, lon) for projects ArcGIS knows about.
+    """
+    # projectID is numeric on the layer; anything else can't be queried.
+    pids = sorted({str(p) for p in pids if str(p).isdigit()})
+    if not pids:
+        return {}
+
+    session = session or make_session()
+    batch_size = _arcgis_max_records(session)
+    locations = {}
+
+    for i in range(0, len(pids), batch_size):
+        batch = pids[i:i + batch_size]
+        params = {
+            "f": "json",
+            "outFields": "projectID,X_match,Y_match",
+            "returnGeometry": "false",
+            "spatialRel": "esriSpatialRelIntersects",
+            "where": f"projectID IN ({','.join(batch)})"
+        }
+        try:
+            r = default_cache().post(f"{ARCGIS_LAYER}/query", data=params,
+                                     session=session, timeout=API_TIMEOUT)
+            r.raise_for_status()
+            features = r.json().get("features", [])
+        except Exception as e:
+            # Not fatal — we can still write rows without coordinates.
+            print(f"[ERROR] Failed to query ArcGIS for {len(batch)} projects: {e}")
+            continue
+
+        for feat in features:
+            attr = feat.get("attributes", {})
+            pid = str(attr.get("projectID"))
+            lat, lon = attr.get("Y_match"), attr.get("X_match")
+            if pid not in locations and lat and lon:
+                locations[pid] = (lat, lon)
+
+    print(f"[ARCGIS] Located {len(locations)} / {len(pids)} projects "
+          f"in {-(-len(pids) // batch_size)} request(s)")
+    return locations
+
+
+def query_arcgis_for_lat_lon(pid):
+    """
+    Single-project convenience wrapper around query_arcgis_locations().
 
     Returns:
         tuple[float|None, float|None]: (lat, lon) if available, else (None, None).
     """
-    url = "https://eplanning.blm.gov/arcgisfed/rest/services/Proj_Loc_FO/BLM_ePlan_Proj_Loc/MapServer/4/query"
-    params = {
-        "f": "json",
-        "outFields": "*",
-        "returnGeometry": "false",
-        "spatialRel": "esriSpatialRelIntersects",
-        "where": f"projectID={pid}"
+    return query_arcgis_locations([pid]).get(str(pid), (None, None))
+
+
+def attach_locations(records, session=None):
+    """
+    Fill latitude/longitude on records in place with one batched ArcGIS lookup.
+
+    Returns:
+        list[dict]: The same records, for chaining.
+    """
+    if not records:
+        return records
+    locations = query_arcgis_locations([rec["project_id"] for rec in records], session=session)
+    for rec in records:
+        lat, lon = locations.get(str(rec["project_id"]), (None, None))
+        if lat and lon:
+            rec["latitude"], rec["longitude"] = lat, lon
+    return records
+
+
+class AsyncHostRateLimiter:
+    """
+    Tiny async rate limiter: spaces out requests so each host sees at most `rate` per second.
+
+    Every caller reserves the next free slot for its host and sleeps until that slot,
+    so concurrent workers queue up fairly instead of bursting. (The thread-based
+    http_cache.HostRateLimiter is its counterpart for plain HTTP worker threads.)
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = {}
+
+    async def wait(self, url):
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def build_record(pid, full_text):
+    """
+    Turn the combined tab text for a project into a CSV record, or None if there's
+    no public comment language in it.
+
+    Args:
+        pid (str): Project ID.
+        full_text (str): Text gathered from the project's tabs.
+
+    Returns:
+        dict | None: Record ready for save_to_csv(), or None for non-hits.
+    """
+    # If there's no hint of public comment, we bail early for this project.
+    if "public comment" not in full_text.lower():
+        return None
+
+    # Pull a date (if any) and make a best-guess at the state
+    start_date = extract_date(full_text)
+    state = extract_state(full_text)
+
+    # We keep the schema compact; downstream steps can enrich further.
+    # Coordinates are filled later in one batched ArcGIS call (attach_locations).
+    return {
+        "project_id": pid,
+        "state": state,
+        "latitude": None,
+        "longitude": None,
+        "start_date": start_date,
+        "comment_start": start_date,  # conservative: same as start_date if only one date is known
+        "comment_end": start_date,    # conservative: same as start_date if only one date is known
+        "confidence": 0.8,            # soft signal — we saw “public comment” language
+        "url": PROJECT_URL.format(pid=pid, tab="510")
     }
-    try:
-        r = requests.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
-        features = data.get("features", [])
-        if features:
-            attr = features[0].get("attributes", {})
-            lat = attr.get("Y_match")
-            lon = attr.get("X_match")
-            print(f"[ARCGIS] Project {pid} lat/lon: {lat}, {lon}")
-            return lat, lon
-    except Exception as e:
-        # Not fatal — we can still write a row without coordinates.
-        print(f"[ERROR] Failed to query ArcGIS for {pid}: {e}")
-    return None, None
 
 
-def scrape_projects(ids):
+def _is_conclusive(text):
+    """
+    True once the text has public comment language and a date (nothing left to learn).
+    """
+    return "public comment" in text.lower() and extract_date(text) is not None
+
+
+async def _crawl_project(page, pid, limiter, tabs=PROJECT_TABS, stats=None):
+    """
+    Visit project tabs on a single page and return the concatenated body text.
+
+    Tabs are loaded in `tabs` order and we stop as soon as the text gathered so far is
+    conclusive (public comment + a date). `stats`, if given, counts tab loads done
+    and skipped.
+
+    Returns None if no tab loaded at all (network blip, browser crash), so callers can
+    tell "nothing to see here" apart from "we never actually saw it".
+    """
+    full_text = ""
+    loaded = False
+
+    # Walk through a few known tabs that often host relevant info.
+    for i, tab in enumerate(tabs):
+        url = PROJECT_URL.format(pid=pid, tab=tab)
+        await limiter.wait(url)
+        if stats is not None:
+            stats["tab_loads"] += 1
+        try:
+            await page.goto(url)
+            await wait_until_ready_async(page)
+            full_text += await page.inner_text("body") + "\n"
+            loaded = True
+        except Exception:
+            # Some tabs may not load or may block text extraction; we skip quietly.
+            continue
+
+        if _is_conclusive(full_text):
+            if stats is not None and i < len(tabs) - 1:
+                stats["early_exits"] += 1
+                stats["tab_loads_saved"] += len(tabs) - 1 - i
+            break
+
+    return full_text if loaded else None
+
+
+async def scrape_projects_async(ids, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, fingerprints=None,
+                                tabs=PROJECT_TABS, journal=None):
+    """
+    Crawl project tabs with a bounded pool of browser pages.
+
+    Each worker owns its own browser context + page and pulls the next project ID
+    off a shared queue, so wall time scales with the pool size rather than the
+    number of projects. All workers share one per-host rate limiter.
+
+    Args:
+        ids (list[str]): Project IDs from discover_ids().
+        concurrency (int): Number of browser pages crawling at once.
+        rate (float): Max page loads per second per host (0 disables the limit).
+        fingerprints (dict | None): If given, filled with pid -> content fingerprint.
+        tabs (tuple[str]): Tabs to scan, most-likely-to-have-a-notice first.
+        journal (CrawlJournal | None): Checkpoint each finished project here.
+
+    Returns:
+        list[dict]: Records for projects with public comment language, in `ids` order.
+    """
+    queue = asyncio.Queue()
+    for pid in ids:
+        queue.put_nowait(pid)
+
+    limiter = AsyncHostRateLimiter(rate)
+    found = {}
+    stats = {"tab_loads": 0, "tab_loads_saved": 0, "early_exits": 0}
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+
+        async def worker():
+            context = await browser.new_context()
+            page = await context.new_page()
+            try:
+                while True:
+                    try:
+                        pid = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    print(f"[INFO] Scraping project {pid}")
+                    full_text = await _crawl_project(page, pid, limiter, tabs=tabs, stats=stats)
+                    if full_text is None:
+                        # Not fingerprinted or journaled, so it stays pending for a retry.
+                        print(f"[WARN] No tab loaded for project {pid}; leaving it for the next run")
+                        continue
+                    content_fp = fingerprint(full_text)
+                    if fingerprints is not None:
+                        fingerprints[pid] = content_fp
+                    record = build_record(pid, full_text)
+                    if record:
+                        print("Project with comment:", record)
+                        found[pid] = record
+                    if journal is not None:
+                        journal.append(pid, content_fp, record)
+            finally:
+                await context.close()
+
+        n_workers = max(1, min(int(concurrency), len(ids)))
+        await asyncio.gather(*(worker() for _ in range(n_workers)))
+        await browser.close()
+
+    print(f"[INFO] Tab loads: {stats['tab_loads']} done, {stats['tab_loads_saved']} saved "
+          f"by early exit on {stats['early_exits']} / {len(ids)} projects")
+
+    records = [found[pid] for pid in ids if pid in found]
+
+    # One batched ArcGIS lookup for every hit instead of a request per project.
+    return await asyncio.to_thread(attach_locations, records)
+
+
+def scrape_projects(ids, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, fingerprints=None,
+                    tabs=PROJECT_TABS, journal=None):
     """
     Given a bunch of project IDs, visit a few useful tabs and look for public comment hints.
 
@@ -169,66 +570,399 @@ def scrape_projects(ids):
     - 570, 565, 5101 (these tend to hold notices or supporting info)
 
     Behavior:
-    - We concatenate the text from all visited tabs and scan it once.
+    - We concatenate the text from visited tabs, stopping early once it already has
+      public comment language and a date.
     - If the text contains "public comment", we try to extract a date and state.
-    - If ArcGIS has coordinates, we use them.
+    - If ArcGIS has coordinates, we use them (one batched lookup for all hits).
+    - Projects are crawled concurrently (see scrape_projects_async); concurrency=1
+      gives the old one-page-at-a-time behavior.
 
     Args:
         ids (list[str]): Project IDs from discover_ids().
+        concurrency (int): Number of browser pages crawling at once.
+        rate (float): Max page loads per second per host.
+        fingerprints (dict | None): If given, filled with pid -> content fingerprint.
+        tabs (tuple[str]): Tabs to scan, in order.
+        journal (CrawlJournal | None): Checkpoint each finished project here.
 
     Returns:
         list[dict]: Lightweight records ready to be written to CSV.
     """
-    records = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    if not ids:
+        return []
+    return asyncio.run(scrape_projects_async(ids, concurrency=concurrency, rate=rate,
+                                             fingerprints=fingerprints, tabs=tabs, journal=journal))
 
-        for pid in ids:
-            print(f"[INFO] Scraping project {pid}")
-            full_text = ""
-
-            # Walk through a few known tabs that often host relevant info.
-            for tab in ("510", "570", "565", "5101"):
-                url = f"https://eplanning.blm.gov/eplanning-ui/project/{pid}/{tab}"
-                page.goto(url)
-                page.wait_for_timeout(800)  # small pause to allow content to render
-
-                try:
-                    full_text += page.inner_text("body") + "\n"
-                except:
-                    # Some tabs may not load or may block text extraction; we skip quietly.
-                    continue
-
-            # Pull a date (if any) and make a best-guess at the state
-            start_date = extract_date(full_text)
-            state = extract_state(full_text)
-            lat, lon = None, None
-
-            # If there's no hint of public comment, we bail early for this project.
-            if "public comment" in full_text.lower():
-                # Optional: override coords with ArcGIS location if available.
-                arcgis_lat, arcgis_lon = query_arcgis_for_lat_lon(pid)
-                if arcgis_lat and arcgis_lon:
-                    lat, lon = arcgis_lat, arcgis_lon
-
-                # We keep the schema compact; downstream steps can enrich further.
-                record = {
-                    "project_id": pid,
-                    "state": state,
-                    "latitude": lat,
-                    "longitude": lon,
-                    "start_date": start_date,
-                    "comment_start": start_date,  # conservative: same as start_date if only one date is known
-                    "comment_end": start_date,    # conservative: same as start_date if only one date is known
-                    "confidence": 0.8,            # soft signal — we saw “public comment” language
-                    "url": f"https://eplanning.blm.gov/eplanning-ui/project/{pid}/510"
-                }
-                print("Project with comment:", record)
-                records.append(record)
 
-        browser.close()
+# ------------ JSON API engine ------------
+def _api_items(payload):
+    """
+    Find the list of result rows in a search response, whatever the wrapper key is.
+    """
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in ("results", "content", "projects", "data", "items"):
+            if isinstance(payload.get(key), list):
+                return payload[key]
+    return []
+
+
+def _api_project_id(item):
+    """
+    Pull a project ID out of a search row (field name varies between API versions).
+    """
+    for key in ("projectId", "projectID", "project_id", "id"):
+        val = item.get(key) if isinstance(item, dict) else None
+        if val is not None and re.fullmatch(r"\d{6,}", str(val)):
+            return str(val)
+    return None
+
+
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:[T ].*)?$")
+
+
+def _json_to_text(obj, key=""):
+    """
+    Flatten a project-detail JSON document into "key: value" lines.
+
+    This lets the API path reuse the same text heuristics as the browser path:
+    - keys stay as-is (camelCase), so "public comment" can only match *values* — a
+      project with `publicCommentPeriod: false` or `""` is not a hit;
+    - a comment-related field holding a real date becomes a "Public comment (<key>): date"
+      line, so a scheduled comment period counts even without narrative text;
+    - ISO timestamps become MM/DD/YYYY so extract_date() recognizes them.
+    """
+    if isinstance(obj, dict):
+        return "\n".join(_json_to_text(v, k) for k, v in obj.items())
+    if isinstance(obj, list):
+        return "\n".join(_json_to_text(v, key) for v in obj)
+    if obj is None:
+        return ""
+    val = str(obj)
+    m = _ISO_DATE_RE.match(val)
+    if m:
+        val = f"{m.group(2)}/{m.group(3)}/{m.group(1)}"
+    if "comment" in key.lower() and find_dates(val, kinds=(LONG, MDY)):
+        return f"Public comment ({key}): {val}"
+    return f"{key}: {val}" if key else val
+
+
+def discover_listings_api(session=None):
+    """
+    Page through the search API with the Colorado filter and collect project IDs
+    plus each search row (as compact JSON) for change detection.
+
+    Returns:
+        dict[str, str]: Project ID -> listing JSON, or {} if the API didn't answer
+        (callers can fall back to the browser-based discover_listings()).
+    """
+    session = session or make_session()
+    listings = {}
+    page_no = 0
+    while True:
+        body = dict(SEARCH_FILTER, page=page_no, pageSize=API_PAGE_SIZE)
+        try:
+            r = default_cache().post(API_SEARCH_URL, json=body, headers=API_HEADERS,
+                                     session=session, timeout=API_TIMEOUT)
+            r.raise_for_status()
+            items = _api_items(r.json())
+        except Exception as e:
+            print(f"[ERROR] Search API failed on page {page_no}: {e}")
+            break
+        new = {}
+        for item in items:
+            pid = _api_project_id(item)
+            if pid:
+                new[pid] = json.dumps(item, sort_keys=True, default=str)
+        if not new.keys() - listings.keys():
+            break
+        listings.update(new)
+        if len(items) < API_PAGE_SIZE:
+            break
+        page_no += 1
+    return listings
+
+
+def discover_ids_api(session=None):
+    """
+    Sorted project IDs from the search API (see discover_listings_api()).
+    """
+    return sorted(discover_listings_api(session))
+
+
+def fetch_project_text_api(pid, session=None):
+    """
+    Fetch one project's detail JSON and flatten it to text.
+
+    Returns:
+        str | None: Flattened text, or None if the API couldn't resolve this project.
+    """
+    session = session or make_session()
+    try:
+        r = default_cache().get(API_PROJECT_URL.format(pid=pid), headers=API_HEADERS,
+                                session=session, timeout=API_TIMEOUT)
+        r.raise_for_status()
+        text = _json_to_text(r.json())
+    except Exception as e:
+        print(f"[WARN] API could not resolve project {pid}: {e}")
+        return None
+    return text or None
+
 
+def scrape_projects_api(ids, session=None, fingerprints=None, journal=None):
+    """
+    API-only counterpart to scrape_projects(): a couple of small HTTP calls per project
+    instead of rendering four tabs in Chromium.
+
+    `fingerprints`, if given, is filled with pid -> content fingerprint; `journal`, if
+    given, gets a checkpoint for each resolved project.
+
+    Returns:
+        tuple[list[dict], list[str]]: (records, unresolved IDs that need the browser path)
+    """
+    session = session or make_session()
+    records, unresolved = [], []
+    for pid in ids:
+        print(f"[INFO] Fetching project {pid} via API")
+        text = fetch_project_text_api(pid, session=session)
+        if text is None:
+            unresolved.append(pid)
+            continue
+        content_fp = fingerprint(text)
+        if fingerprints is not None:
+            fingerprints[pid] = content_fp
+        record = build_record(pid, text)
+        if record:
+            print("Project with comment:", record)
+            records.append(record)
+        if journal is not None:
+            journal.append(pid, content_fp, record)
+    return attach_locations(records, session=session), unresolved
+
+
+# ------------ Incremental crawl state ------------
+def fingerprint(text):
+    """
+    Short, whitespace-insensitive content hash used to spot changes between runs.
+    """
+    normalized = " ".join((text or "").split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+def load_crawl_state(path=CRAWL_STATE_PATH):
+    """
+    Read the persisted crawl state ({} if there isn't one yet or it's unreadable).
+
+    Each entry: listing_fp, content_fp, last_seen, last_checked, last_changed, record.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable crawl state {path}: {e}")
+        return {}
+
+
+def save_crawl_state(state, path=CRAWL_STATE_PATH):
+    """
+    Write the crawl state atomically (temp file + rename).
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def plan_crawl(listings, state, stale_after_days=STALE_AFTER_DAYS, now=None):
+    """
+    Decide which projects need a visit this run.
+
+    A project is fetched if it's new, its listing metadata changed, or we last checked
+    it more than `stale_after_days` ago. Everything else reuses the stored record.
+
+    Returns:
+        tuple[list[str], list[dict]]: (IDs to fetch, reused records for the rest)
+    """
+    now = now or _utcnow()
+    cutoff = now - timedelta(days=stale_after_days)
+    to_fetch, reused = [], []
+    for pid in sorted(listings):
+        entry = state.get(pid)
+        if (not entry
+                or entry.get("listing_fp") != fingerprint(listings[pid])
+                or datetime.fromisoformat(entry.get("last_checked", "1970-01-01T00:00:00+00:00")) < cutoff):
+            to_fetch.append(pid)
+        elif entry.get("record"):
+            reused.append(entry["record"])
+    return to_fetch, reused
+
+
+def update_crawl_state(state, listings, records, fingerprints, now=None):
+    """
+    Fold this run's results into the state (in place).
+
+    - Every listed project gets last_seen.
+    - Fetched projects (those in `fingerprints`) get listing_fp, last_checked, their
+      record (or None for non-hits), and last_changed when their content fingerprint moved.
+
+    `fingerprints` must only hold projects whose fetch actually succeeded. A project
+    we failed to load keeps its previous listing_fp, record and last_checked, so one bad
+    fetch can't wipe a known comment record, and plan_crawl() retries it next run.
+    """
+    stamp = (now or _utcnow()).isoformat()
+    by_pid = {rec["project_id"]: rec for rec in records}
+    for pid in listings:
+        state.setdefault(pid, {})["last_seen"] = stamp
+    for pid, content_fp in fingerprints.items():
+        entry = state.setdefault(pid, {})
+        if pid in listings:
+            entry["listing_fp"] = fingerprint(listings[pid])
+        if entry.get("content_fp") != content_fp:
+            entry["content_fp"] = content_fp
+            entry["last_changed"] = stamp
+        entry["last_checked"] = stamp
+        entry["record"] = by_pid.get(pid)
+    return state
+
+
+class CrawlJournal:
+    """
+    Append-only JSONL checkpoint of finished projects for the crawl in progress.
+
+    Every line is {"pid", "content_fp", "record", "checked_at"} and is flushed + fsynced
+    before we move on, so a crash loses at most the project being worked on. A clean
+    finish clears the journal; the next run after a crash replays it and skips those
+    projects. Entries older than JOURNAL_MAX_AGE_HOURS are ignored, so a journal left
+    behind long ago can't stand in for a fresh visit.
+    """
+
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+
+    def load(self, max_age_hours=JOURNAL_MAX_AGE_HOURS, now=None):
+        """
+        Replay the journal, skipping entries older than `max_age_hours`.
+
+        Returns:
+            dict[str, dict]: pid -> {"content_fp", "record", "checked_at"} for finished projects.
+        """
+        cutoff = (now or _utcnow()) - timedelta(hours=max_age_hours)
+        done, stale = {}, 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        checked_at = datetime.fromisoformat(entry["checked_at"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # torn last line from a crash mid-write, or an unstamped entry
+                    if checked_at < cutoff:
+                        stale += 1
+                        continue
+                    done[entry["pid"]] = entry
+        except FileNotFoundError:
+            pass
+        if stale:
+            print(f"[INFO] Ignoring {stale} journal entries older than {max_age_hours}h")
+        return done
+
+    def append(self, pid, content_fp, record):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        line = json.dumps({"pid": pid, "content_fp": content_fp, "record": record,
+                           "checked_at": _utcnow().isoformat()})
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def crawl(engine="browser", concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+          state_path=CRAWL_STATE_PATH, stale_after_days=STALE_AFTER_DAYS, full=False,
+          tabs=PROJECT_TABS, journal_path=JOURNAL_PATH, resume=True):
+    """
+    End-to-end BLM crawl: discover, skip what hasn't changed, visit the rest.
+
+    Args:
+        engine (str): "browser" (Playwright) or "api" (JSON endpoints, browser fallback).
+        concurrency (int): Browser pages crawling at once.
+        rate (float): Max page loads per second per host.
+        state_path (str): Where the incremental crawl state lives.
+        stale_after_days (float): Re-check unchanged projects after this long.
+        full (bool): Ignore stored state and visit every project.
+        tabs (tuple[str]): Browser tab scan order.
+        journal_path (str): Checkpoint journal for this crawl.
+        resume (bool): Replay a leftover journal from an interrupted run (else discard it).
+
+    Returns:
+        list[dict]: Records for every listed project with public comment language.
+    """
+    session = make_session() if engine == "api" else None
+
+    # 1) Find Colorado projects (API first when asked, browser UI as a backstop)
+    listings = (discover_listings_api(session) if engine == "api" else {}) or discover_listings()
+    ids = sorted(listings)
+    print("Found IDs:", ids)
+
+    # 2) Only new, changed, or stale projects get a visit
+    state = {} if full else load_crawl_state(state_path)
+    to_fetch, reused = plan_crawl(listings, state, stale_after_days)
+    print(f"[INFO] Incremental crawl: {len(to_fetch)} to fetch, {len(ids) - len(to_fetch)} unchanged")
+
+    # 3) Pick up where an interrupted run left off
+    journal = CrawlJournal(journal_path)
+    done = journal.load() if resume else {}
+    if not resume:
+        journal.clear()
+    resumed = [pid for pid in to_fetch if pid in done]
+    if resumed:
+        print(f"[INFO] Resuming: {len(resumed)} projects already done in the journal")
+    to_fetch = [pid for pid in to_fetch if pid not in done]
+
+    # 4) Visit each project and look for public comment indicators
+    fingerprints = {pid: done[pid]["content_fp"] for pid in resumed}
+    if engine == "api":
+        # Resolve what we can over HTTP; only the leftovers get a browser
+        records, unresolved = scrape_projects_api(to_fetch, session=session, fingerprints=fingerprints,
+                                                  journal=journal)
+        if unresolved:
+            print(f"[INFO] Falling back to Playwright for {len(unresolved)} projects")
+            records += scrape_projects(unresolved, concurrency=concurrency, rate=rate,
+                                       fingerprints=fingerprints, tabs=tabs, journal=journal)
+    else:
+        records = scrape_projects(to_fetch, concurrency=concurrency, rate=rate,
+                                  fingerprints=fingerprints, tabs=tabs, journal=journal)
+
+    # Journaled records were checkpointed before the ArcGIS batch, so locate them now.
+    records += attach_locations([done[pid]["record"] for pid in resumed if done[pid].get("record")],
+                                session=session)
+
+    save_crawl_state(update_crawl_state(state, listings, records, fingerprints), state_path)
+    journal.clear()
+
+    # Projects we couldn't load this time keep their last known record (and stay due).
+    failed = [pid for pid in to_fetch if pid not in fingerprints]
+    if failed:
+        print(f"[WARN] {len(failed)} projects could not be fetched; keeping their last known records")
+        records += [state[pid]["record"] for pid in failed if state.get(pid, {}).get("record")]
+
+    records += reused
+    order = {pid: i for i, pid in enumerate(ids)}
+    records.sort(key=lambda rec: order.get(rec["project_id"], len(order)))
     return records
 
 
@@ -257,12 +991,32 @@ def save_to_csv(records, path="data/interim/blm_public_comment.csv"):
 
 
 if __name__ == "__main__":
-    # 1) Find Colorado project IDs from the search UI
-    ids = discover_ids()
-    print("Found IDs:", ids)
-
-    # 2) Visit each project and look for public comment indicators
-    records = scrape_projects(ids)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Number of browser pages crawling project tabs at once")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="Max page loads per second per host (0 = unlimited)")
+    parser.add_argument("--engine", choices=["browser", "api"], default="browser",
+                        help="Render pages with Playwright, or read the ePlanning JSON API directly")
+    parser.add_argument("--state", default=CRAWL_STATE_PATH,
+                        help="Incremental crawl state file")
+    parser.add_argument("--stale-days", type=float, default=STALE_AFTER_DAYS,
+                        help="Re-check unchanged projects after this many days")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore crawl state and re-visit every project")
+    parser.add_argument("--tabs", default=",".join(PROJECT_TABS),
+                        help="Comma-separated project tabs in scan order (scanning stops early on a hit)")
+    parser.add_argument("--journal", default=JOURNAL_PATH,
+                        help="Checkpoint journal used to resume an interrupted crawl")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Discard a leftover journal instead of resuming from it")
+    args = parser.parse_args()
+
+    # 1-2) Discover projects and visit the ones that are new, changed, or stale
+    records = crawl(engine=args.engine, concurrency=args.concurrency, rate=args.rate,
+                    state_path=args.state, stale_after_days=args.stale_days, full=args.full,
+                    tabs=tuple(t.strip() for t in args.tabs.split(",") if t.strip()),
+                    journal_path=args.journal, resume=not args.no_resume)
 
     # 3) Dump a simple CSV for the rest of the pipeline to consume
     save_to_csv(records)
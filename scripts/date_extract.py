@@ -0,0 +1,71 @@
+"""
+Shared date extraction for the BLM and USFS scrapers
+
+What this does (in plain English):
+- Scans a blob of text once with a single precompiled pattern that recognizes the
+  date shapes our sources use:
+    * long form      "July 15, 2025"
+    * numeric        "07/15/2025"
+    * month + year   "07/2025"   (anchored to the 1st of the month)
+- Turns each hit into a datetime.date with a month-name lookup table (no strptime),
+  and hands back every date with where it was found, in text order.
+
+Notes & guardrails:
+- Month names must be capitalized, matching how ePlanning/SOPA print them.
+- Impossible dates ("February 30, 2025") are skipped rather than raising.
+- Numeric dates are tried before month + year, so "11/12/2025" is one date,
+  not a stray "12/2025".
+"""
+
+import re
+from collections import namedtuple
+from datetime import date
+
+LONG = "long"     # "Month DD, YYYY"
+MDY = "mdy"       # "MM/DD/YYYY"
+MONTH = "month"   # "MM/YYYY"
+
+MONTHS = {
+    name: i for i, name in enumerate(
+        ["January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"], start=1)
+}
+
+_DATE_RE = re.compile(
+    r"\b(?P<l_month>" + "|".join(MONTHS) + r")\s+(?P<l_day>\d{1,2}),\s+(?P<l_year>\d{4})\b"
+    r"|\b(?P<n_month>\d{1,2})/(?P<n_day>\d{1,2})/(?P<n_year>\d{4})\b"
+    r"|\b(?P<m_month>0[1-9]|1[0-2])/(?P<m_year>\d{4})\b"
+)
+
+DateMatch = namedtuple("DateMatch", ["date", "start", "end", "kind"])
+
+
+def find_dates(text, kinds=None):
+    """
+    Find every date in `text` in one pass.
+
+    Args:
+        text (str): Any blob of page/report text.
+        kinds (Iterable[str] | None): Restrict to some of LONG, MDY, MONTH (default: all).
+
+    Returns:
+        list[DateMatch]: (date, start, end, kind) tuples in the order they appear.
+    """
+    if not text:
+        return []
+    wanted = set(kinds) if kinds else None
+    found = []
+    for m in _DATE_RE.finditer(text):
+        g = m.groupdict()
+        try:
+            if g["l_month"]:
+                kind, d = LONG, date(int(g["l_year"]), MONTHS[g["l_month"]], int(g["l_day"]))
+            elif g["n_month"]:
+                kind, d = MDY, date(int(g["n_year"]), int(g["n_month"]), int(g["n_day"]))
+            else:
+                kind, d = MONTH, date(int(g["m_year"]), int(g["m_month"]), 1)
+        except ValueError:
+            continue
+        if wanted is None or kind in wanted:
+            found.append(DateMatch(d, m.start(), m.end(), kind))
+    return found
@@ -2,31 +2,50 @@
 USFS district-centric enrichment (turn “unit” text into map-ready coordinates)
 
 What this does (in plain English):
-- Loads the national USFS Ranger Districts layer from the EDW REST service.
+- Loads the national USFS Ranger Districts layer from the EDW REST service, and keeps a
+  slim local copy (FlatGeobuf with a spatial index: unit_name, unit_lc, geometry) that is
+  only rebuilt when the service's layer metadata changes.
 - Normalizes the “unit” text coming out of SOPA (e.g., “Leadville RD”, “Bears Ears”)
   so it matches actual EDW district names.
 - For each CSV row, finds all matching district polygons, unions them if needed,
-  and drops a centroid. If a row already has lon/lat, we leave it alone.
+  and drops a centroid. Rows that match the same set of districts share one
+  union/centroid computation. If a row already has lon/lat, we leave it alone.
 - Writes an updated CSV with coordinates and a "matched_units" breadcrumb for QA.
 
 Notes & guardrails:
 - District names in SOPA aren’t perfectly standardized, so we do a few surgical
   cleanups (“RD” -> “Ranger District”, strip zones, tidy punctuation) and allow
-  simple alias overrides.
+  simple alias overrides. Units that still don't match exactly get a fuzzy
+  (rapidfuzz) fallback against a small candidate set, and the match score is
+  recorded so weak matches are easy to audit.
 - If we can’t match a unit, we don’t fail the row — lon/lat stay None, and
   “matched_units” will be empty. That’s a signal for future tuning, not a crash.
 - Everything is handled in EPSG:4326 for easy downstream use.
+- REST calls go through the shared on-disk cache (http_cache.py), so re-runs against
+  an unchanged layer don't re-download it.
 """
 
 # scripts/enrich_with_district_geoms.py
+import argparse
+import hashlib
 import json
+import os
 import re
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-import requests
-from shapely.ops import unary_union
+import shapely
+from rapidfuzz import fuzz, process
+
+try:  # imported as part of the scripts package (e.g. from tests)
+    from .http_cache import cached_get, default_cache
+except ImportError:  # run directly as `python scripts/<name>.py`
+    from http_cache import cached_get, default_cache
 
 # ------------ Config ------------
 INPUT_CSV = "data/interim/usfs_public_comment.csv"
@@ -35,6 +54,13 @@ OUT_CSV   = "data/processed/usfs_public_comment_with_geom.csv"
 # USFS EDW Ranger Districts - National extent (layer 0)
 LAYER_BASE = "https://apps.fs.usda.gov/arcx/rest/services/EDW/EDW_RangerDistricts_01/MapServer/0"
 
+# Local district store (slim copy of the layer) + sidecar with the layer version it came from.
+DISTRICT_STORE = "data/cache/ranger_districts.fgb"
+STORE_FORMAT_VERSION = 1  # bump if the stored columns change
+
+# District name fields vary by layer version; first one present wins.
+NAME_FIELDS = ["DISTRICTNAME", "RDNAME", "NAME"]
+
 # Optional aliases for tricky names (left = normalized unit name, right = actual EDW name)
 ALIASES = {
     # SOPA sometimes says "Bears Ears RD" but EDW calls the district "Hahns Peak/Bears Ears"
@@ -42,20 +68,47 @@ ALIASES = {
     # add more here if needed, e.g. "leadville rd": "leadville ranger district"
 }
 
+# Fuzzy fallback: minimum rapidfuzz score to accept, and how many trigram-blocked
+# candidates we actually score per unmatched unit.
+FUZZY_SCORE_CUTOFF = 88
+FUZZY_MAX_CANDIDATES = 25
+
 # ------------ REST loader (robust) ------------
 def _get_json(url, params=None, timeout=60):
     """
-    Small wrapper around requests.get + JSON decode with basic error handling.
+    Small wrapper around an uncached GET + JSON decode with basic error handling.
+
+    Feature queries only run when the district store is being rebuilt, so they always
+    go to the network (pooled session, same retries): a cached page could predate the
+    layer change that triggered the rebuild, and the store is already our local copy.
     """
-    r = requests.get(url, params=params or {}, timeout=timeout)
+    r = default_cache().session.get(url, params=params or {}, timeout=timeout)
     r.raise_for_status()
     return r.json()
 
 def _layer_info():
     """
     Pull layer metadata so we know maxRecordCount and whether pagination is supported.
+
+    Always revalidated (ttl=0): it's tiny, and it's how we notice the layer changed.
+    """
+    r = cached_get(LAYER_BASE, params={"f": "json"}, ttl=0, timeout=60)
+    r.raise_for_status()
+    return r.json()
+
+def _layer_version(info):
     """
-    return _get_json(LAYER_BASE, {"f": "json"})
+    Fingerprint the parts of the layer metadata that change when the data does.
+    """
+    relevant = {
+        "store_format": STORE_FORMAT_VERSION,
+        "currentVersion": info.get("currentVersion"),
+        "editingInfo": info.get("editingInfo"),
+        "fields": [f.get("name") for f in info.get("fields") or []],
+        "extent": info.get("extent"),
+    }
+    raw = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 def _query_geojson(params):
     """
@@ -74,9 +127,84 @@ def _query_json(params):
     q["f"] = "json"
     return _get_json(f"{LAYER_BASE}/query", q)
 
-def load_ranger_districts():
+def _store_meta_path(store_path):
+    return Path(store_path).with_suffix(".meta.json")
+
+def _read_store(store_path, version=None):
+    """
+    Load the local district store if it exists (and matches `version`, when given).
+    """
+    store, meta_path = Path(store_path), _store_meta_path(store_path)
+    if not (store.exists() and meta_path.exists()):
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if version is not None and meta.get("version") != version:
+            return None
+        gdf = gpd.read_file(store)
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable district store {store}: {e}")
+        return None
+    return gdf.set_crs(4326, allow_override=True)[["unit_name", "unit_lc", "geometry"]]
+
+def _write_store(gdf, store_path, version):
+    """
+    Write the slim district table as FlatGeobuf (with spatial index) + a version sidecar.
+
+    Both files are written to temp names and renamed into place, so a crash mid-write
+    never leaves a store that looks current but isn't.
+    """
+    store = Path(store_path)
+    store.parent.mkdir(parents=True, exist_ok=True)
+    tmp = store.with_name(f".{store.stem}.tmp{store.suffix}")  # GDAL picks the layout by suffix
+    gdf.to_file(tmp, driver="FlatGeobuf", SPATIAL_INDEX="YES")
+    os.replace(tmp, store)
+    meta_tmp = store.with_name(f".{store.name}.meta.tmp")
+    meta_tmp.write_text(json.dumps({
+        "version": version,
+        "features": int(len(gdf)),
+        "written_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "source": LAYER_BASE,
+    }, indent=2), encoding="utf-8")
+    os.replace(meta_tmp, _store_meta_path(store))
+
+def load_ranger_districts(store_path=DISTRICT_STORE, refresh=False):
+    """
+    Load USFS Ranger Districts as a GeoDataFrame, normalized for matching.
+
+    Store logic:
+    - Check the layer metadata; if the local store was built from the same layer version,
+      read it straight from disk (no feature download at all).
+    - If the metadata can't be fetched (offline), fall back to whatever store we have.
+    - Otherwise (or with refresh=True) download, slim down, and rewrite the store.
+
+    Returns:
+        GeoDataFrame with columns: unit_name (original), unit_lc (lowercased key), geometry
+    """
+    try:
+        info = _layer_info()
+    except Exception as e:
+        gdf = _read_store(store_path)
+        if gdf is None:
+            raise
+        print(f"[WARN] Layer metadata unavailable ({e}); using local district store")
+        return gdf
+
+    version = _layer_version(info)
+    if not refresh:
+        gdf = _read_store(store_path, version)
+        if gdf is not None:
+            print(f"[INFO] District store is current ({store_path})")
+            return gdf
+
+    print("[INFO] Downloading district layer (store missing or out of date)...")
+    gdf = _download_ranger_districts(info)
+    _write_store(gdf, store_path, version)
+    return gdf
+
+def _download_ranger_districts(info):
     """
-    Download the full USFS Ranger Districts layer as a GeoDataFrame, normalized for matching.
+    Download the USFS Ranger Districts layer (name field + geometry only).
 
     Pagination logic:
     - If the service supports pagination, we page through result sets.
@@ -85,7 +213,10 @@ def load_ranger_districts():
     Returns:
         GeoDataFrame with columns: unit_name (original), unit_lc (lowercased key), geometry
     """
-    info = _layer_info()
+    # Only ask for the name field we need (falls back to * if the metadata doesn't list one).
+    layer_fields = {f.get("name") for f in info.get("fields") or []}
+    out_fields = next((f for f in NAME_FIELDS if f in layer_fields), "*")
+
     max_count = int(info.get("maxRecordCount", 1000))
     supports_pagination = bool(info.get("supportsPagination", False))
     chunks = []
@@ -96,7 +227,7 @@ def load_ranger_districts():
         while True:
             gdf = _query_geojson({
                 "where": "1=1",
-                "outFields": "*",
+                "outFields": out_fields,
                 "outSR": "4326",
                 "returnGeometry": "true",
                 "resultOffset": offset,
@@ -117,7 +248,7 @@ def load_ranger_districts():
                 subset = ",".join(map(str, oids[i:i+max_count]))
                 gdf = _query_geojson({
                     "objectIds": subset,
-                    "outFields": "*",
+                    "outFields": out_fields,
                     "outSR": "4326",
                     "returnGeometry": "true",
                 })
@@ -127,7 +258,7 @@ def load_ranger_districts():
             # Absolute fallback: try a single query
             gdf = _query_geojson({
                 "where": "1=1",
-                "outFields": "*",
+                "outFields": out_fields,
                 "outSR": "4326",
                 "returnGeometry": "true",
             })
@@ -140,16 +271,51 @@ def load_ranger_districts():
         raise RuntimeError("No features retrieved from USFS Ranger Districts layer.")
 
     # District name fields vary by layer version; pick the first that exists.
-    name_field = next((f for f in ["DISTRICTNAME", "RDNAME", "NAME"] if f in gdf_all.columns), None)
+    name_field = next((f for f in NAME_FIELDS if f in gdf_all.columns), None)
     if not name_field:
         raise RuntimeError(f"District name field not found. Columns: {list(gdf_all.columns)}")
 
     gdf_all["unit_name"] = gdf_all[name_field].astype(str)
     gdf_all["unit_lc"] = gdf_all["unit_name"].str.strip().str.lower()
     gdf_all = gdf_all.set_crs(4326, allow_override=True)
-    return gdf_all[["unit_name", "unit_lc", "geometry"]]
+    return gpd.GeoDataFrame(gdf_all[["unit_name", "unit_lc", "geometry"]], geometry="geometry", crs=4326)
 
 # ------------ Matching helpers ------------
+# Precompiled once; normalize_unit_text runs for every unit of every row.
+_WS_RE = re.compile(r"\s+")
+_RD_SUFFIX_RE = re.compile(r"\bRD\b\.?$", re.IGNORECASE)
+_RDS_PLURAL_RE = re.compile(r"\bRanger Districts\b", re.IGNORECASE)
+_RD_FULL_SUFFIX_RE = re.compile(r"ranger district$", re.IGNORECASE)
+_DISTRICT_SUFFIX_RE = re.compile(r"\bdistrict$", re.IGNORECASE)
+
+# Memo size for distinct raw unit strings (SOPA reuses a small vocabulary).
+UNIT_CACHE_SIZE = 4096
+
+def _aliases_lc() -> dict[str, str]:
+    return {k.lower(): v for k, v in ALIASES.items()}
+
+_ALIASES_LC = _aliases_lc()
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _normalize_unit_cached(unit: str) -> tuple[str, ...]:
+    parts = [p.strip() for p in unit.split(",") if p.strip()]
+    cleaned = []
+    for p in parts:
+        seg = p.split("/")[-1]          # drop 'East Zone/' etc.
+        seg = _WS_RE.sub(" ", seg).strip()
+        seg = seg.rstrip(" .;:")        # remove trailing punctuation
+        seg = _RD_SUFFIX_RE.sub("Ranger District", seg)
+        seg = _RDS_PLURAL_RE.sub("Ranger District", seg)
+        if not _RD_FULL_SUFFIX_RE.search(seg):
+            if _DISTRICT_SUFFIX_RE.search(seg):
+                seg = _DISTRICT_SUFFIX_RE.sub("Ranger District", seg)
+            else:
+                seg = f"{seg} Ranger District"
+        # alias fixups (compare in lowercase)
+        seg = _ALIASES_LC.get(seg.lower(), seg)
+        cleaned.append(seg)
+    return tuple(cleaned)
+
 def normalize_unit_text(unit: str | None) -> list[str]:
     """
     Normalize SOPA 'unit' strings to EDW district names (list to support multi-unit rows).
@@ -161,38 +327,124 @@ def normalize_unit_text(unit: str | None) -> list[str]:
     - Tidy stray punctuation.
     - Apply ALIASES (lowercased compare) for known mismatches.
 
+    Results are memoized per raw string (LRU, UNIT_CACHE_SIZE entries), so repeated
+    units across rows/runs are effectively free; see normalize_unit_cache_info().
+
     Returns:
         list[str]: normalized candidate district names (title strings, not lowercased keys).
     """
     if not unit or pd.isna(unit):
         return []
-    parts = [p.strip() for p in unit.split(",") if p.strip()]
-    cleaned = []
-    for p in parts:
-        seg = p.split("/")[-1]          # drop 'East Zone/' etc.
-        seg = re.sub(r"\s+", " ", seg).strip()
-        seg = seg.rstrip(" .;:")        # remove trailing punctuation
-        seg = re.sub(r"\bRD\b\.?$", "Ranger District", seg, flags=re.IGNORECASE)
-        seg = re.sub(r"\bRanger Districts\b", "Ranger District", seg, flags=re.IGNORECASE)
-        if not re.search(r"ranger district$", seg, flags=re.IGNORECASE):
-            if re.search(r"\bdistrict$", seg, flags=re.IGNORECASE):
-                seg = re.sub(r"\bdistrict$", "Ranger District", seg, flags=re.IGNORECASE)
-            else:
-                seg = f"{seg} Ranger District"
-        # alias fixups (compare in lowercase)
-        seg_lc = seg.lower()
-        if seg_lc in ALIASES:
-            seg = ALIASES[seg_lc]
-        cleaned.append(seg)
-    return cleaned
+    return list(_normalize_unit_cached(str(unit)))
+
+def normalize_unit_cache_info():
+    """
+    Hit/miss counters for the unit normalizer memo (functools CacheInfo).
+    """
+    return _normalize_unit_cached.cache_info()
+
+def reset_unit_normalizer():
+    """
+    Clear the memo and re-read ALIASES (call after editing ALIASES at runtime).
+    """
+    global _ALIASES_LC
+    _ALIASES_LC = _aliases_lc()
+    _normalize_unit_cached.cache_clear()
+
+def build_district_index(districts_gdf: gpd.GeoDataFrame) -> dict[str, tuple[list[str], list]]:
+    """
+    Hash index from lowercased district key to its names and geometries.
+
+    Built once per districts GeoDataFrame so each unit lookup is a dict hit instead of
+    a scan over every national district. A key can map to several rows (multi-part
+    districts), so values are parallel lists.
 
-def compute_centroids_csv(csv_path: str, districts_gdf: gpd.GeoDataFrame) -> pd.DataFrame:
+    Returns:
+        dict[str, tuple[list[str], list]]: unit_lc -> ([unit_name, ...], [geometry, ...])
+    """
+    index: dict[str, tuple[list[str], list]] = {}
+    for key, name, geom in zip(districts_gdf["unit_lc"], districts_gdf["unit_name"], districts_gdf.geometry):
+        names, geoms = index.setdefault(key, ([], []))
+        names.append(name)
+        geoms.append(geom)
+    return index
+
+# Words every district name shares; useless for narrowing candidates.
+_GENERIC_TOKENS = {"ranger", "district", "districts", "national", "forest", "grassland", "the", "and", "of"}
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def _trigrams(text: str) -> set[str]:
+    """
+    Character trigrams of the informative (non-generic) words in `text`.
+    """
+    grams = set()
+    for tok in _TOKEN_RE.findall(text.lower()):
+        if tok in _GENERIC_TOKENS:
+            continue
+        padded = f"  {tok} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def _distinctive(text: str) -> str:
+    """
+    Just the informative words of a district name, lowercased ("Yampa Ranger District" -> "yampa").
+
+    Used as the rapidfuzz processor so the shared "ranger district" suffix can't pad
+    the score of two different districts.
+    """
+    return " ".join(tok for tok in _TOKEN_RE.findall(text.lower()) if tok not in _GENERIC_TOKENS)
+
+def build_fuzzy_index(index: dict) -> dict[str, set[str]]:
+    """
+    Trigram -> district keys, built once over the district index keys.
+
+    Used to block fuzzy matching: an unmatched unit is only scored against the
+    districts that share the most trigrams with it, never the whole national list.
+    """
+    fuzzy_index: dict[str, set[str]] = {}
+    for key in index:
+        for gram in _trigrams(key):
+            fuzzy_index.setdefault(gram, set()).add(key)
+    return fuzzy_index
+
+def fuzzy_match_unit(name: str, fuzzy_index: dict[str, set[str]],
+                     score_cutoff: float = FUZZY_SCORE_CUTOFF,
+                     max_candidates: int = FUZZY_MAX_CANDIDATES) -> tuple[str | None, float | None]:
+    """
+    Best fuzzy district key for a normalized unit name, or (None, None).
+
+    Names are scored on their distinctive words only (see _distinctive()), so
+    "Yampa" vs "Tampa" is judged as such rather than buoyed by "Ranger District".
+
+    Returns:
+        tuple[str | None, float | None]: (district key, rapidfuzz score 0-100 on the distinctive words)
+    """
+    counts = Counter()
+    for gram in _trigrams(name):
+        counts.update(fuzzy_index.get(gram, ()))
+    if not counts:
+        return None, None
+    candidates = [k for k, _ in counts.most_common(max_candidates)]
+    hit = process.extractOne(name, candidates, scorer=fuzz.token_sort_ratio,
+                             processor=_distinctive, score_cutoff=score_cutoff)
+    return (hit[0], float(hit[1])) if hit else (None, None)
+
+def compute_centroids_csv(csv_path: str, districts_gdf: gpd.GeoDataFrame,
+                          index: dict | None = None, fuzzy: bool = True,
+                          score_cutoff: float = FUZZY_SCORE_CUTOFF) -> pd.DataFrame:
     """
     Read the USFS CSV, match 'unit' to district polygons, and compute centroids.
 
     Matching behavior:
-    - We try each normalized unit name against the districts lookup (lowercased key).
+    - We look up each normalized unit name in the district index (lowercased key);
+      pass a prebuilt `index` from build_district_index() to reuse it across calls.
     - If multiple districts match for a row, we union them and take the centroid.
+    - Rows are grouped by their matched district set, so each distinct set is
+      unioned once and all centroids come from one shapely 2 vectorized call.
+    - Units with no exact hit fall back to fuzzy_match_unit() (unless fuzzy=False).
+      "match_score" is the weakest unit score in the row: 100 = all exact, a unit that
+      matched nothing scores 0, and rows with no units at all get None.
+      "unmatched_units" counts the units in the row that matched nothing.
     - If none match, lon/lat stay None (so you can spot misses later).
 
     Returns:
@@ -200,34 +452,59 @@ def compute_centroids_csv(csv_path: str, districts_gdf: gpd.GeoDataFrame) -> pd.
     """
     df = pd.read_csv(csv_path)
 
-    # Lightweight lookup with lowercased unit key.
-    lut = districts_gdf[["unit_lc", "geometry", "unit_name"]].copy()
-
-    centroids_x, centroids_y, matched_units = [], [], []
-
-    for _, r in df.iterrows():
-        units = normalize_unit_text(r.get("unit"))
-        unit_geoms = []
-        matched_list = []
-
-        for u in units:
-            key = u.strip().lower()
-            m = lut[lut["unit_lc"] == key]
-            if not m.empty:
-                unit_geoms.extend(list(m.geometry))
-                matched_list.extend(list(m["unit_name"]))
-
-        if unit_geoms:
+    # O(1) lookup by lowercased unit key.
+    if index is None:
+        index = build_district_index(districts_gdf)
+
+    fuzzy_index = build_fuzzy_index(index) if fuzzy else None
+
+    def resolve(name):
+        key = name.strip().lower()
+        if key in index:
+            return key, 100.0
+        if fuzzy_index is not None:
+            return fuzzy_match_unit(name, fuzzy_index, score_cutoff=score_cutoff)
+        return None, None
+
+    # 1) Per row: the sorted tuple of district keys it matched (order/dupes don't matter).
+    #    Resolved once per distinct raw unit string.
+    units = df["unit"] if "unit" in df.columns else pd.Series([None] * len(df), index=df.index)
+    resolved = {}
+    row_keys, match_scores, unmatched_counts = [], [], []
+    for unit in units:
+        memo_key = unit if isinstance(unit, str) else None
+        if memo_key not in resolved:
+            hits = [resolve(u) for u in normalize_unit_text(unit)]
+            resolved[memo_key] = (
+                tuple(sorted({k for k, _ in hits if k})),
+                min((score if k else 0.0 for k, score in hits), default=None),
+                sum(1 for k, _ in hits if not k),
+            )
+        keys, score, unmatched = resolved[memo_key]
+        row_keys.append(keys)
+        match_scores.append(score)
+        unmatched_counts.append(unmatched)
+
+    # 2) One union per *distinct* district set, then all centroids in a single vectorized call.
+    distinct = sorted({keys for keys in row_keys if keys})
+    by_set = {}
+    if distinct:
+        geoms = []
+        for keys in distinct:
+            parts = [g for k in keys for g in index[k][1]]
             # If multiple districts apply, union them first, then take the centroid.
-            geom = unary_union(unit_geoms)
-            c = geom.centroid
-            centroids_x.append(float(c.x))
-            centroids_y.append(float(c.y))
-            matched_units.append(";".join(matched_list) if matched_list else None)
-        else:
-            centroids_x.append(None)
-            centroids_y.append(None)
-            matched_units.append(None)
+            geoms.append(parts[0] if len(parts) == 1 else shapely.union_all(parts))
+        cents = shapely.centroid(np.asarray(geoms, dtype=object))
+        xs, ys = shapely.get_x(cents), shapely.get_y(cents)
+        for keys, x, y in zip(distinct, xs, ys):
+            names = ";".join(n for k in keys for n in index[k][0])
+            by_set[keys] = (float(x), float(y), names or None)
+
+    # 3) Broadcast results back to rows.
+    misses = (None, None, None)
+    centroids_x = [by_set.get(keys, misses)[0] for keys in row_keys]
+    centroids_y = [by_set.get(keys, misses)[1] for keys in row_keys]
+    matched_units = [by_set.get(keys, misses)[2] for keys in row_keys]
 
     out = df.copy()
 
@@ -241,6 +518,8 @@ def compute_centroids_csv(csv_path: str, districts_gdf: gpd.GeoDataFrame) -> pd.
         pd.Series(centroids_y),
     )
     out["matched_units"] = matched_units
+    out["match_score"] = match_scores
+    out["unmatched_units"] = unmatched_counts
 
     return out
 
@@ -249,21 +528,41 @@ def main():
     """
     CLI entrypoint: load districts, enrich the CSV, and write the results out.
     """
-    Path(OUT_CSV).parent.mkdir(parents=True, exist_ok=True)
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--csv-in", default=INPUT_CSV, help="USFS CSV to enrich")
+    ap.add_argument("--csv-out", default=OUT_CSV, help="Where to write the enriched CSV")
+    ap.add_argument("--district-store", default=DISTRICT_STORE,
+                    help="Local FlatGeobuf copy of the Ranger Districts layer")
+    ap.add_argument("--refresh-districts", action="store_true",
+                    help="Rebuild the district store even if the layer looks unchanged")
+    ap.add_argument("--no-fuzzy", action="store_true",
+                    help="Only accept exact (normalized) district name matches")
+    ap.add_argument("--fuzzy-cutoff", type=float, default=FUZZY_SCORE_CUTOFF,
+                    help="Minimum rapidfuzz score (0-100) for a fuzzy district match")
+    args = ap.parse_args()
+
+    Path(args.csv_out).parent.mkdir(parents=True, exist_ok=True)
 
     print("[INFO] Loading USFS Ranger Districts...")
-    districts = load_ranger_districts()
+    districts = load_ranger_districts(args.district_store, refresh=args.refresh_districts)
     print(f"[INFO] District features: {len(districts)}")
 
     print("[INFO] Computing centroids from matched districts...")
-    out_df = compute_centroids_csv(INPUT_CSV, districts)
+    out_df = compute_centroids_csv(args.csv_in, districts, fuzzy=not args.no_fuzzy,
+                                   score_cutoff=args.fuzzy_cutoff)
 
     # Quick report for sanity: how many rows now have coordinates?
     matched = int(out_df["longitude"].notna().sum())
     print(f"[INFO] Centroids available for {matched} / {len(out_df)} rows")
-
-    out_df.to_csv(OUT_CSV, index=False)
-    print(f"[INFO] Wrote CSV -> {OUT_CSV}")
+    partial_rows = int((out_df["unmatched_units"] > 0).sum())
+    fuzzy_rows = int(((out_df["unmatched_units"] == 0) & (out_df["match_score"] < 100)).sum())
+    print(f"[INFO] Rows with at least one unmatched unit: {partial_rows}")
+    print(f"[INFO] Rows relying on a fuzzy district match: {fuzzy_rows}")
+    info = normalize_unit_cache_info()
+    print(f"[INFO] Unit normalizer cache: {info.hits} hits, {info.misses} misses")
+
+    out_df.to_csv(args.csv_out, index=False)
+    print(f"[INFO] Wrote CSV -> {args.csv_out}")
     print("[DONE]")
 
 if __name__ == "__main__":
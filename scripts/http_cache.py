@@ -0,0 +1,405 @@
+"""
+Shared on-disk HTTP cache (so re-runs don't re-download unchanged sources)
+
+What this does (in plain English):
+- Wraps requests with a small file cache keyed by method + URL + params/body.
+- If a cached copy is younger than its TTL, we hand it back without touching the network.
+- Once it's older, we revalidate with a conditional GET (If-None-Match / If-Modified-Since);
+  a 304 just refreshes the timestamp, a 200 replaces the body.
+- Bodies are streamed straight to disk, and the cache is trimmed (least recently used
+  first) whenever it grows past a size budget.
+
+Notes & guardrails:
+- Only 200 responses are stored; anything else is passed through untouched.
+- If the network fails and we have a stale copy, we serve the stale copy with a warning
+  rather than failing the whole run.
+- Writes go to a temp file in the cache dir and are renamed into place, so parallel
+  workers never see half-written entries.
+- Config via env vars: HTTP_CACHE_DIR, HTTP_CACHE_TTL (seconds), HTTP_CACHE_MAX_BYTES,
+  and HTTP_CACHE_DISABLE=1 to bypass the cache entirely.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+# ------------ Config ------------
+CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", "data/cache/http")
+DEFAULT_TTL = float(os.environ.get("HTTP_CACHE_TTL", 6 * 3600))              # trust a copy this long
+MAX_BYTES = int(os.environ.get("HTTP_CACHE_MAX_BYTES", 2 * 1024 ** 3))        # evict above this size
+DISABLED = os.environ.get("HTTP_CACHE_DISABLE", "").lower() in ("1", "true", "yes")
+CHUNK_SIZE = 1 << 16
+SPOOL_MAX_BYTES = 32 * 1024 ** 2   # uncached streamed bodies stay in RAM up to this, then spill to disk
+
+_DEFAULT = object()  # sentinel: "use the cache's own TTL"
+
+
+def make_session(pool_size=8, retries=3):
+    """
+    One pooled requests.Session (keeps TCP/TLS connections warm).
+
+    Transient failures (429/5xx, dropped connections) are retried with backoff.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"HEAD", "GET", "POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, holding at most `burst`.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available, then take it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    One token bucket per host, so parallel workers stay polite to each server.
+
+    Args:
+        rate (float): Requests per second allowed per host (<= 0 disables limiting).
+        burst (int): Requests a host may receive back-to-back before throttling.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.rate or self.rate <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
+
+
+class CachedResponse:
+    """
+    Minimal requests.Response look-alike backed by a cache file, a spooled buffer,
+    or in-memory bytes.
+    """
+
+    def __init__(self, url, status_code, headers, path=None, content=None, from_cache=False,
+                 fileobj=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.path = path
+        self.from_cache = from_cache
+        self._content = content
+        self._file = fileobj
+
+    @property
+    def content(self):
+        if self._content is None:
+            if self._file is not None:
+                self._file.seek(0)
+                self._content = self._file.read()
+            else:
+                self._content = Path(self.path).read_bytes() if self.path else b""
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def encoding(self):
+        ctype = self.headers.get("Content-Type", "")
+        if "charset=" in ctype:
+            return ctype.split("charset=")[-1].split(";")[0].strip() or "utf-8"
+        return "utf-8"
+
+    def json(self):
+        return json.loads(self.content)
+
+    def open(self):
+        """
+        Binary, seekable file handle on the body without making another copy: the cache
+        file itself, the spooled buffer of a streamed response, or the bytes in memory.
+        """
+        if self._file is not None:
+            self._file.seek(0)
+            return self._file
+        if self.path and self._content is None:
+            return open(self.path, "rb")
+        return io.BytesIO(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class HttpCache:
+    """
+    File-backed HTTP cache with TTL, conditional revalidation and size-based eviction.
+
+    Args:
+        cache_dir (str | Path): Where entries live (one .body + one .json per key).
+        ttl (float | None): Seconds a copy is served without revalidating; None = forever.
+        max_bytes (int): Total body size budget before LRU eviction kicks in.
+        session (requests.Session | None): Default session for network calls.
+        enabled (bool): If False, every call goes straight to the network.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=MAX_BYTES,
+                 session=None, enabled=not DISABLED):
+        self.dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.session = session
+        self.enabled = enabled
+        self._evict_lock = threading.Lock()
+
+    # ---- keys + paths ----
+    @staticmethod
+    def key(method, url, params=None, data=None, json_body=None):
+        """
+        Stable cache key for a request (param order doesn't matter).
+        """
+        def norm(v):
+            return sorted(v.items()) if isinstance(v, dict) else v
+        raw = json.dumps([method.upper(), url, norm(params), norm(data), json_body],
+                         sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        sub = self.dir / key[:2]
+        return sub / f"{key}.body", sub / f"{key}.json"
+
+    def _load_meta(self, meta_path, body_path):
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_atomic(path, write):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _hit(self, url, meta, body_path):
+        """
+        Serve a cached body, or None if another thread evicted it since we looked.
+        """
+        try:
+            os.utime(body_path)  # mark as recently used for eviction
+        except FileNotFoundError:
+            return None
+        return CachedResponse(url, 200, meta.get("headers"), path=body_path, from_cache=True)
+
+    # ---- requests ----
+    def request(self, method, url, params=None, data=None, json=None, headers=None,
+                ttl=_DEFAULT, timeout=60, session=None, limiter=None, stream=False):
+        """
+        Cached equivalent of session.request(). Returns a CachedResponse.
+
+        Args:
+            ttl: Override the cache TTL for this call (0 = always revalidate, None = never).
+            limiter (HostRateLimiter | None): Throttle applied only when we actually hit
+                the network (fresh cache hits are free).
+            stream (bool): With the cache disabled, stream the body into a spooled buffer
+                (RAM up to SPOOL_MAX_BYTES, then a temp file) instead of one big bytes
+                object; read it via CachedResponse.open(). Cached bodies always stream
+                to the cache file.
+        """
+        session = session or self.session or requests
+        base_headers = dict(headers or {})
+        headers = dict(base_headers)
+
+        if not self.enabled:
+            if limiter:
+                limiter.wait(url)
+            r = session.request(method, url, params=params, data=data, json=json,
+                                headers=headers, timeout=timeout, stream=stream)
+            if not stream:
+                return CachedResponse(url, r.status_code, r.headers, content=r.content)
+            with r:
+                buf = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+                for chunk in r.iter_content(CHUNK_SIZE):
+                    buf.write(chunk)
+            return CachedResponse(url, r.status_code, r.headers, fileobj=buf)
+
+        ttl = self.ttl if ttl is _DEFAULT else ttl
+        key = self.key(method, url, params, data, json)
+        body_path, meta_path = self._paths(key)
+        meta = self._load_meta(meta_path, body_path)
+
+        if meta and (ttl is None or time.time() - meta.get("stored_at", 0) < ttl):
+            hit = self._hit(url, meta, body_path)
+            if hit:
+                return hit
+            meta = None  # evicted under us; fetch it fresh
+
+        # Stale (or missing): revalidate if the server gave us validators last time.
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        if limiter:
+            limiter.wait(url)
+        try:
+            r = session.request(method, url, params=params, data=data, json=json,
+                                headers=headers, timeout=timeout, stream=True)
+        except requests.RequestException as e:
+            hit = self._hit(url, meta, body_path) if meta else None
+            if hit:
+                print(f"[WARN] Network error for {url}, serving stale cache: {e}")
+                return hit
+            raise
+
+        with r:
+            if r.status_code == 304 and meta:
+                hit = self._hit(url, meta, body_path)
+                if hit:
+                    meta["stored_at"] = time.time()
+                    self._write_atomic(meta_path, lambda f: f.write(_dumps(meta)))
+                    return hit
+                # Body evicted while we revalidated; ask again, this time without validators.
+                return self.request(method, url, params=params, data=data, json=json,
+                                    headers=base_headers, ttl=ttl, timeout=timeout,
+                                    session=session, limiter=limiter)
+
+            if r.status_code != 200:
+                return CachedResponse(url, r.status_code, r.headers, content=r.content)
+
+            # Stream the body to disk; never hold the whole thing in memory here.
+            def copy_body(f):
+                for chunk in r.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+            self._write_atomic(body_path, copy_body)
+            meta = {
+                "url": url,
+                "stored_at": time.time(),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "headers": {k: v for k, v in r.headers.items() if k.lower() == "content-type"},
+            }
+            self._write_atomic(meta_path, lambda f: f.write(_dumps(meta)))
+
+        self.evict(keep=body_path)  # never the body we're about to hand back
+        return CachedResponse(url, 200, meta["headers"], path=body_path)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    # ---- housekeeping ----
+    def evict(self, keep=None):
+        """
+        Drop least-recently-used entries until the cache fits in max_bytes.
+
+        Args:
+            keep (Path | None): Body path to spare even if it alone exceeds the budget
+                (it still counts towards the total, and goes on a later pass).
+
+        Returns:
+            int: Number of entries removed.
+        """
+        # One eviction pass at a time per cache; parallel workers just wait their turn.
+        with self._evict_lock:
+            bodies = []
+            for p in self.dir.glob("*/*.body"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue  # removed by someone else since the glob
+                bodies.append((st.st_mtime, st.st_size, p))
+            total = sum(size for _, size, _ in bodies)
+            removed = 0
+            for _, size, body in sorted(bodies):
+                if total <= self.max_bytes:
+                    break
+                if body == keep:
+                    continue
+                for path in (body, body.with_suffix(".json")):
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                removed += 1
+            return removed
+
+
+def _dumps(meta):
+    return json.dumps(meta).encode("utf-8")
+
+
+_default_cache = None
+
+
+def default_cache():
+    """
+    Process-wide cache instance shared by every script (lazy, env-configured).
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpCache(session=make_session())
+    return _default_cache
+
+
+def cached_get(url, params=None, **kwargs):
+    """
+    Shorthand for default_cache().get(...).
+    """
+    return default_cache().get(url, params=params, **kwargs)
@@ -17,6 +17,11 @@ Why minimal?
 Outputs:
 - CSV:     project_name, source, start_date, end_date, notes, longitude, latitude, geometry_wkt
 - GeoJSON: FeatureCollection of Points with the same minimal properties
+           (or, with --geojson-format seq, one Feature per line)
+
+Both outputs are streamed: inputs are read in chunks (--chunksize rows at a time),
+and each chunk's rows are written as soon as they're mapped, so memory stays bounded
+even for multi-state / multi-year dumps.
 
 Usage:
   python scripts/finalize_opportunities.py \
@@ -28,69 +33,196 @@ Usage:
 
 from __future__ import annotations
 import argparse
+import csv
 import json
-import math
+import os
+import re
+import tempfile
+from collections import Counter
+from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from dateutil import parser as dateutil_parser
+
+try:  # imported as part of the scripts package (e.g. from tests)
+    from .date_extract import MONTHS
+except ImportError:  # run directly as `python scripts/<name>.py`
+    from date_extract import MONTHS
 
 # ---- CRS detection + conversion (EPSG:3857 -> EPSG:4326) ----
 R_MERC = 6378137.0  # Web Mercator sphere radius used for conversion heuristics
 
-def looks_like_3857(lon_str: str, lat_str: str) -> bool:
+# Coordinate classes reported by normalize_lonlat()
+COORD_DEGREES = "degrees"
+COORD_MERCATOR = "mercator"
+COORD_INVALID = "invalid"
+
+def classify_coords(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
     """
-    Quick-and-dirty check: if values are way outside lon/lat ranges, they’re probably 3857 meters.
+    Label every lon/lat pair as degrees, Web Mercator meters, or invalid (missing,
+    non-numeric, or neither plausible degrees nor meters). Values way outside lon/lat
+    ranges are probably 3857 meters.
     """
-    try:
-        x = float(lon_str)
-        y = float(lat_str)
-    except Exception:
-        return False
-    degish = (-180 <= x <= 180) and (-90 <= y <= 90)
-    mercish = (abs(x) > 1000) or (abs(y) > 1000)
-    return (not degish) and mercish
+    finite = np.isfinite(lon) & np.isfinite(lat)
+    degish = finite & (lon >= -180) & (lon <= 180) & (lat >= -90) & (lat <= 90)
+    mercish = finite & ~degish & ((np.abs(lon) > 1000) | (np.abs(lat) > 1000))
+    return np.select([degish, mercish], [COORD_DEGREES, COORD_MERCATOR], default=COORD_INVALID)
 
-def merc3857_to_wgs84(x: float, y: float) -> Tuple[float, float]:
+def merc3857_to_wgs84(x, y) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Convert Web Mercator meters (EPSG:3857) to lon/lat in degrees (EPSG:4326).
+    Convert Web Mercator meters (EPSG:3857) to lon/lat in degrees (EPSG:4326), clamped
+    to valid ranges. Works on scalars or whole arrays (one NumPy pass).
     This is good enough for points destined for a web map.
     """
-    lon = (x / R_MERC) * (180.0 / math.pi)
-    lat = (2.0 * math.atan(math.exp(y / R_MERC)) - math.pi / 2.0) * (180.0 / math.pi)
-    # Clamp to valid ranges just in case.
-    lat = max(min(lat, 90.0), -90.0)
-    lon = max(min(lon, 180.0), -180.0)
-    return lon, lat
+    lon = np.degrees(x / R_MERC)
+    lat = np.degrees(2.0 * np.arctan(np.exp(y / R_MERC)) - np.pi / 2.0)
+    return np.clip(lon, -180.0, 180.0), np.clip(lat, -90.0, 90.0)
+
+def normalize_lonlat(lon_raw, lat_raw, allow_3857: bool = True) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    Clean whole lon/lat columns into WGS84 degrees.
+
+    Args:
+        lon_raw, lat_raw: Array-likes of strings or numbers (e.g. DataFrame columns).
+        allow_3857: Convert pairs that look like Web Mercator meters; if False those
+            are treated as invalid, since that source never emits meters.
+
+    Returns:
+        (lon, lat, counts): float arrays with NaN for invalid pairs, plus how many pairs
+        fell in each class ({"degrees": n, "mercator": n, "invalid": n}).
+    """
+    lon = pd.to_numeric(pd.Series(lon_raw), errors="coerce").to_numpy(dtype=float, copy=True)
+    lat = pd.to_numeric(pd.Series(lat_raw), errors="coerce").to_numpy(dtype=float, copy=True)
+    kind = classify_coords(lon, lat)
+    if not allow_3857:
+        kind[kind == COORD_MERCATOR] = COORD_INVALID
+
+    merc = kind == COORD_MERCATOR
+    lon[merc], lat[merc] = merc3857_to_wgs84(lon[merc], lat[merc])
+    bad = kind == COORD_INVALID
+    lon[bad] = lat[bad] = np.nan
+
+    counts = {c: int(np.count_nonzero(kind == c)) for c in (COORD_DEGREES, COORD_MERCATOR, COORD_INVALID)}
+    return lon, lat, counts
+
+# ---- Date normalization ----
+# Fast paths for the shapes our scrapers actually emit; dateutil only sees the leftovers.
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ].*)?")       # 2025-07-15[T...]
+_MDY_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")                 # 07/15/2025
+_LONG_DATE_RE = re.compile(r"([A-Za-z]+)\.?\s+(\d{1,2}),?\s+(\d{4})")      # July 15, 2025 / Jul 15 2025
+_MONTH_LOOKUP = {**{m.lower(): i for m, i in MONTHS.items()},
+                 **{m[:3].lower(): i for m, i in MONTHS.items()}}
+# dateutil fills missing fields from a default; parsing against two defaults that differ in
+# year and month exposes strings lacking either ("July 15", "Monday"), which we reject.
+_DATEUTIL_DEFAULTS = (datetime(2000, 1, 1), datetime(2001, 2, 1))  # missing day -> the 1st
+
+# Per-path tallies over every value normalized (not just distinct strings):
+# how many values took each path, and how many of those were served from the memo.
+TO_ISO_PATHS = ("iso", "mdy", "long", "dateutil", "unparsed", "blank")
+TO_ISO_COUNTS: Counter = Counter()
+TO_ISO_CACHE_HITS: Counter = Counter()
+TO_ISO_MEMO_MAX = 65536  # distinct strings remembered before the memo starts over
+_TO_ISO_MEMO: dict[str, tuple[str, str]] = {}
+
+def _parse_iso(s: str) -> tuple[str, str]:
+    """
+    (YYYY-MM-DD or "", path taken) for one non-blank string.
+    """
+    m = _ISO_DATE_RE.fullmatch(s)
+    if m:
+        path, ymd = "iso", (m.group(1), m.group(2), m.group(3))
+    else:
+        m = _MDY_DATE_RE.fullmatch(s)
+        if m:
+            path, ymd = "mdy", (m.group(3), m.group(1), m.group(2))
+        else:
+            m = _LONG_DATE_RE.fullmatch(s)
+            month = _MONTH_LOOKUP.get(m.group(1).lower()) if m else None
+            path, ymd = ("long", (m.group(3), month, m.group(2))) if month else (None, None)
+    if path:
+        try:
+            return date(int(ymd[0]), int(ymd[1]), int(ymd[2])).isoformat(), path
+        except ValueError:
+            pass  # right shape, impossible date; let dateutil decide
+
+    try:
+        a, b = (dateutil_parser.parse(s, default=d).date() for d in _DATEUTIL_DEFAULTS)
+    except (ValueError, OverflowError):
+        return "", "unparsed"
+    if a != b:
+        return "", "unparsed"  # no year or no month in the string; don't invent one
+    return a.isoformat(), "dateutil"
+
+def _lookup_iso(d) -> tuple[str, str, bool]:
+    """
+    (result, path, served from memo?) for any value, without touching the tallies.
+    """
+    if d is None or (not isinstance(d, str) and pd.isna(d)):
+        return "", "blank", False
+    s = str(d).strip()
+    if not s:
+        return "", "blank", False
+    hit = _TO_ISO_MEMO.get(s)
+    if hit is not None:
+        return hit[0], hit[1], True
+    if len(_TO_ISO_MEMO) >= TO_ISO_MEMO_MAX:
+        _TO_ISO_MEMO.clear()
+    result, path = _TO_ISO_MEMO[s] = _parse_iso(s)
+    return result, path, False
 
 def to_iso(d: str) -> str:
     """
     Normalize any date-like value to YYYY-MM-DD. Return empty string if unsure.
+
+    ISO, MM/DD/YYYY and "Month DD, YYYY" are recognized directly; anything else goes
+    to dateutil. Results are memoized, since the same few dates repeat a lot, and every
+    call is tallied by the path it took (see to_iso_stats()).
     """
-    if not d or pd.isna(d):
-        return ""
-    try:
-        return pd.to_datetime(d).date().isoformat()
-    except Exception:
-        return ""
+    result, path, cached = _lookup_iso(d)
+    TO_ISO_COUNTS[path] += 1
+    TO_ISO_CACHE_HITS[path] += cached
+    return result
 
-def first_nonempty(row: pd.Series, candidates: list[str]) -> str:
+def to_iso_stats() -> dict:
     """
-    Given a list of candidate columns, return the first one that has a non-blank string.
+    How values have been normalized so far, per path:
+    {"iso": {"values": n, "cached": k}, "mdy": ..., "long": ..., "dateutil": ...,
+     "unparsed": ..., "blank": ...} where `cached` values skipped parsing via the memo.
     """
+    return {path: {"values": TO_ISO_COUNTS[path], "cached": TO_ISO_CACHE_HITS[path]}
+            for path in TO_ISO_PATHS if TO_ISO_COUNTS[path]}
+
+def coalesce_columns(df: pd.DataFrame, candidates: list[str]) -> pd.Series:
+    """
+    For every row, the first candidate column with a non-blank (stripped) value,
+    or "" if none. Missing columns are simply skipped.
+    """
+    out = pd.Series("", index=df.index, dtype=object)
     for c in candidates:
-        if c in row and str(row[c]).strip():
-            return str(row[c]).strip()
-    return ""
+        if c not in df.columns:
+            continue
+        vals = df[c].fillna("").astype(str).str.strip()
+        out = out.where(out != "", vals)
+    return out
 
-def clean_text(s: str) -> str:
+def to_iso_series(s: pd.Series) -> pd.Series:
     """
-    Tidy trailing punctuation/whitespace so popups look nice.
+    Column-wise to_iso(): each distinct value is normalized once and mapped back,
+    so a column full of repeated dates costs only its unique values. The tallies still
+    count every row (repeats within the column count as cached).
+    Anything unparseable (or blank) becomes "".
     """
-    if not s:
-        return ""
-    s = str(s).strip()
-    return s.rstrip(". \t\r\n")
+    mapping = {}
+    for v, n in s.value_counts(dropna=False).items():
+        result, path, cached = _lookup_iso(v)
+        TO_ISO_COUNTS[path] += n
+        if path != "blank":
+            TO_ISO_CACHE_HITS[path] += n if cached else n - 1
+        mapping[v] = result
+    return s.map(mapping).fillna("")
 
 def detect_source(df: pd.DataFrame) -> str:
     """
@@ -117,138 +249,208 @@ def detect_source(df: pd.DataFrame) -> str:
 def map_rows_to_final(df: pd.DataFrame, source_hint: Optional[str]=None) -> List[dict]:
     """
     Convert an input table (BLM or USFS) to our minimal row schema.
+
+    This works a column at a time rather than a row at a time: candidate columns are
+    coalesced once, each date column is parsed in one go, and coordinates are parsed
+    and (if needed) reprojected as NumPy arrays. Rows without usable coordinates are
+    dropped, same as before.
     """
     source = source_hint or detect_source(df)
-    rows: List[dict] = []
-
-    for _, r in df.iterrows():
-        if source == "BLM":
-            # BLM: we often only have an ID and maybe description; treat ID as project_name.
-            pid = first_nonempty(r, ["project_id", "ProjectID", "ID"])
-            notes = first_nonempty(r, ["description", "Summary", "ProjectDescription", "ProjectSummary"])
-            cs = to_iso(first_nonempty(r, ["comment_start", "start_date", "PublicCommentStartDate"]))
-            ce = to_iso(first_nonempty(r, ["comment_end", "PublicCommentEndDate"]))
-
-            # Coordinates can be degrees or 3857 meters depending on where they came from.
-            lon_raw = first_nonempty(r, ["longitude", "Longitude", "X"])
-            lat_raw = first_nonempty(r, ["latitude", "Latitude", "Y"])
-            lon = lat = None
-            if lon_raw and lat_raw:
-                if looks_like_3857(lon_raw, lat_raw):
-                    try:
-                        lon, lat = merc3857_to_wgs84(float(lon_raw), float(lat_raw))
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        lon = float(lon_raw); lat = float(lat_raw)
-                    except Exception:
-                        pass
-
-            if lon is not None and lat is not None:
-                rows.append({
-                    "project_name": pid,
-                    "source": "BLM",
-                    "start_date": cs,
-                    "end_date": ce,
-                    "notes": notes.strip(),
-                    "longitude": lon,
-                    "latitude": lat,
-                })
-
-        else:  # USFS
-            # USFS: we usually have a human-readable name and sometimes a description.
-            name = first_nonempty(r, ["name", "title"])
-            notes = first_nonempty(r, ["location_desc", "notes", "description"])
-            cs = to_iso(first_nonempty(r, ["comment_start", "start_date", "comment_start_date", "expected_comment_start"]))
-            ce = to_iso(first_nonempty(r, ["comment_end", "comment_end_date", "expected_comment_end"]))
-
-            lon_raw = first_nonempty(r, ["longitude"])
-            lat_raw = first_nonempty(r, ["latitude"])
-            lon = lat = None
-            if lon_raw and lat_raw:
-                try:
-                    lon = float(lon_raw); lat = float(lat_raw)
-                except Exception:
-                    pass
-
-            if lon is not None and lat is not None:
-                rows.append({
-                    "project_name": clean_text(name) or "Unnamed project",
-                    "source": "USFS",
-                    "start_date": cs,
-                    "end_date": ce,
-                    "notes": notes.strip(),
-                    "longitude": lon,
-                    "latitude": lat,
-                })
-
-    return rows
-
-def to_geojson(min_rows: List[dict]) -> dict:
-    """
-    Convert our minimal rows into a small, standards-compliant GeoJSON FeatureCollection.
-    """
-    feats = []
-    for r in min_rows:
-        lon = float(r["longitude"])
-        lat = float(r["latitude"])
-        props = {
+
+    if source == "BLM":
+        # BLM: we often only have an ID and maybe description; treat ID as project_name.
+        name = coalesce_columns(df, ["project_id", "ProjectID", "ID"])
+        notes = coalesce_columns(df, ["description", "Summary", "ProjectDescription", "ProjectSummary"])
+        cs = to_iso_series(coalesce_columns(df, ["comment_start", "start_date", "PublicCommentStartDate"]))
+        ce = to_iso_series(coalesce_columns(df, ["comment_end", "PublicCommentEndDate"]))
+
+        # Coordinates can be degrees or 3857 meters depending on where they came from.
+        lon, lat, counts = normalize_lonlat(coalesce_columns(df, ["longitude", "Longitude", "X"]),
+                                            coalesce_columns(df, ["latitude", "Latitude", "Y"]),
+                                            allow_3857=True)
+    else:  # USFS
+        # USFS: we usually have a human-readable name and sometimes a description.
+        # Tidy trailing punctuation/whitespace so popups look nice.
+        name = coalesce_columns(df, ["name", "title"]).str.rstrip(". \t\r\n").replace("", "Unnamed project")
+        notes = coalesce_columns(df, ["location_desc", "notes", "description"])
+        cs = to_iso_series(coalesce_columns(df, ["comment_start", "start_date", "comment_start_date", "expected_comment_start"]))
+        ce = to_iso_series(coalesce_columns(df, ["comment_end", "comment_end_date", "expected_comment_end"]))
+
+        lon, lat, counts = normalize_lonlat(coalesce_columns(df, ["longitude"]),
+                                            coalesce_columns(df, ["latitude"]),
+                                            allow_3857=False)
+
+    print(f"[INFO] {source} coordinates: {counts[COORD_DEGREES]} degrees, "
+          f"{counts[COORD_MERCATOR]} Web Mercator (converted), {counts[COORD_INVALID]} missing/invalid")
+
+    out = pd.DataFrame({
+        "project_name": name,
+        "source": "BLM" if source == "BLM" else "USFS",
+        "start_date": cs,
+        "end_date": ce,
+        "notes": notes,
+        "longitude": lon,
+        "latitude": lat,
+    }, index=df.index)
+    out = out[~(np.isnan(lon) | np.isnan(lat))]
+    return out.to_dict("records")
+
+CSV_FIELDS = ["project_name", "source", "start_date", "end_date", "notes", "longitude", "latitude", "geometry_wkt"]
+GEOJSON_FORMATS = ("collection", "seq")
+DEFAULT_CHUNKSIZE = 50_000  # input rows mapped per batch
+_COMPACT = (",", ":")  # no padding: noticeably smaller published file
+
+def to_feature(r: dict) -> dict:
+    """
+    One minimal row -> one GeoJSON Point Feature.
+    """
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [float(r["longitude"]), float(r["latitude"])]},
+        "properties": {
             "project_name": r.get("project_name", ""),
             "source":       r.get("source", ""),
             "start_date":   r.get("start_date", ""),
             "end_date":     r.get("end_date", ""),
             "notes":        r.get("notes", ""),
-        }
-        feats.append({
-            "type": "Feature",
-            "geometry": {"type": "Point", "coordinates": [lon, lat]},
-            "properties": props,
-        })
-    return {"type": "FeatureCollection", "features": feats}
+        },
+    }
+
+def _default_file_mode() -> int:
+    """Mode a plain open() would give a new file: 0o666 minus the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+class _AtomicOutput:
+    """
+    Base for the streaming writers: rows go to a temp file next to the target, which is
+    renamed into place only when the run finishes cleanly. If anything raises mid-run,
+    the temp file is discarded and the previous output (if any) is left untouched, so
+    make never sees a truncated-but-valid file as "built".
+    """
+
+    def __init__(self, path: str, newline: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, self._tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=Path(path).suffix)
+        self._f = os.fdopen(fd, "w", encoding="utf-8", newline=newline)
+
+    def _finish(self) -> None:
+        """Hook for closing syntax (e.g. the end of a FeatureCollection)."""
+
+    def close(self, ok: bool = True) -> None:
+        try:
+            if ok:
+                self._finish()
+            self._f.close()
+            if ok:
+                os.chmod(self._tmp, _default_file_mode())  # mkstemp files start out 0600
+                os.replace(self._tmp, self.path)
+        finally:
+            if os.path.exists(self._tmp):
+                os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(ok=exc_type is None)
+
+class GeoJSONWriter(_AtomicOutput):
+    """
+    Write features to disk as they arrive instead of building one big dict/string.
+
+    fmt="collection" writes a regular FeatureCollection (what the web map loads);
+    fmt="seq" writes newline-delimited GeoJSON, one Feature per line, which tools like
+    ogr2ogr/tippecanoe can read without parsing the whole file.
+    """
+
+    def __init__(self, path: str, fmt: str = "collection"):
+        if fmt not in GEOJSON_FORMATS:
+            raise ValueError(f"Unknown GeoJSON format: {fmt!r}")
+        super().__init__(path)
+        self.fmt = fmt
+        if fmt == "collection":
+            self._f.write('{"type":"FeatureCollection","features":[')
+
+    def write_rows(self, rows: List[dict]) -> None:
+        for r in rows:
+            feat = json.dumps(to_feature(r), separators=_COMPACT, ensure_ascii=False)
+            if self.fmt == "seq":
+                self._f.write(feat + "\n")
+            else:
+                self._f.write(("," if self.count else "\n") + feat + "\n")
+            self.count += 1
+
+    def _finish(self) -> None:
+        if self.fmt == "collection":
+            self._f.write("]}\n")
+
+class CsvWriter(_AtomicOutput):
+    """
+    Streaming counterpart for the CSV output (adds the geometry_wkt column per row).
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path, newline="")
+        self._w = csv.DictWriter(self._f, fieldnames=CSV_FIELDS)
+        self._w.writeheader()
+
+    def write_rows(self, rows: List[dict]) -> None:
+        for r in rows:
+            # Handy WKT column for quick spatial sanity checks in downstream tools.
+            self._w.writerow({**r, "geometry_wkt": f"POINT ({r['longitude']} {r['latitude']})"})
+            self.count += 1
+
+def iter_mapped_chunks(path: str, chunksize: int = DEFAULT_CHUNKSIZE):
+    """
+    Read one input CSV in bounded batches and yield each batch mapped to the minimal schema.
+
+    The source (BLM/USFS) is detected from the first chunk and reused for the rest,
+    so later chunks can't flip-flop on a stray row. chunksize <= 0 reads the file whole.
+    """
+    reader = pd.read_csv(path, dtype=str, chunksize=chunksize) if chunksize > 0 else [pd.read_csv(path, dtype=str)]
+    source = None
+    for chunk in reader:
+        chunk = chunk.fillna("")
+        source = source or detect_source(chunk)
+        yield map_rows_to_final(chunk, source_hint=source)
 
 def main():
     """
     CLI entrypoint:
-    - Read one or more CSVs (BLM + USFS).
-    - Map each to the minimal schema.
+    - Read one or more CSVs (BLM + USFS), a chunk at a time.
+    - Map each chunk to the minimal schema.
     - Write CSV + GeoJSON to the requested locations.
     """
     ap = argparse.ArgumentParser()
     ap.add_argument("inputs", nargs="+", help="Input CSV files (BLM + USFS enriched)")
     ap.add_argument("--csv", required=True, help="Output CSV path")
     ap.add_argument("--geojson", required=True, help="Output GeoJSON path")
+    ap.add_argument("--geojson-format", choices=GEOJSON_FORMATS, default="collection",
+                    help="FeatureCollection (default) or newline-delimited GeoJSON (one Feature per line)")
+    ap.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                    help=f"Input rows per batch (default {DEFAULT_CHUNKSIZE}; 0 = read each file whole)")
     args = ap.parse_args()
 
-    all_rows: List[dict] = []
-    for p in args.inputs:
-        df = pd.read_csv(p, dtype=str).fillna("")
-        rows = map_rows_to_final(df)
-        all_rows.extend(rows)
-
-    # Final DataFrame for the CSV
-    out = pd.DataFrame(all_rows, columns=[
-        "project_name", "source", "start_date", "end_date", "notes", "longitude", "latitude"
-    ])
-
-    # Handy WKT column for quick spatial sanity checks in downstream tools.
-    def mk_wkt(row):
-        return f"POINT ({row['longitude']} {row['latitude']})"
-    out["geometry_wkt"] = out.apply(mk_wkt, axis=1)
-
     # Ensure output directories exist
     Path(args.csv).parent.mkdir(parents=True, exist_ok=True)
     Path(args.geojson).parent.mkdir(parents=True, exist_ok=True)
 
-    # Write CSV
-    out.to_csv(args.csv, index=False)
-
-    # Write GeoJSON
-    gj = to_geojson(all_rows)
-    Path(args.geojson).write_text(json.dumps(gj, indent=2), encoding="utf-8")
-
-    print(f"[OK] Wrote CSV -> {args.csv}")
-    print(f"[OK] Wrote GeoJSON -> {args.geojson}")
+    # Stream each input's rows straight into both outputs (nothing accumulates here).
+    with CsvWriter(args.csv) as csv_out, GeoJSONWriter(args.geojson, args.geojson_format) as gj_out:
+        for p in args.inputs:
+            for rows in iter_mapped_chunks(p, args.chunksize):
+                csv_out.write_rows(rows)
+                gj_out.write_rows(rows)
+
+    dates = to_iso_stats()
+    print("[INFO] Dates: " + ", ".join(f"{path}={c['values']} ({c['cached']} cached)"
+                                       for path, c in dates.items()))
+    print(f"[OK] Wrote CSV -> {args.csv} ({csv_out.count} rows)")
+    print(f"[OK] Wrote GeoJSON -> {args.geojson} ({gj_out.count} features)")
 
 if __name__ == "__main__":
     main()
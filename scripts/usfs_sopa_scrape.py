@@ -5,15 +5,27 @@ What this does (in plain English):
 - Walks each Colorado forest’s SOPA report (HTML) and looks for rows that reference
   a "Comment Period Public Notice".
 - When we find relevant rows, we extract dates (start/end or best guess) and a name/ID if present.
-- We also download the monthly SOPA PDF for the same forest and do a quick scan for
-  "public comment" language as a safety net.
+- We also download the monthly SOPA PDF for the same forest, split it page by page into
+  per-project blocks, and emit a record for each project with public comment language.
 - Output is a lightweight CSV the rest of the pipeline can consume.
+- Each forest's newest published SOPA cycle (YYYY-MM) is found with cheap HEAD probes;
+  optionally we backfill N earlier months too and de-duplicate projects across cycles.
+  Past cycles never change, so they are cached indefinitely and never re-downloaded.
+- All forests' HTML and PDF reports are fetched concurrently by a small thread pool,
+  throttled per host with a token bucket so we stay good citizens.
+- PDF text extraction is CPU-bound, so each forest's PDF is parsed on a process pool
+  (one PDF per work item, started with "spawn" so it's safe next to our HTTP threads),
+  and the per-page text is cached by PDF content hash (unchanged reports are never
+  re-parsed). That cache is trimmed, oldest first, once it passes a size budget.
+- HTML and PDF downloads go through the shared on-disk cache (http_cache.py), so a
+  re-run against an unchanged report costs a 304 or nothing at all.
 
 Notes & guardrails:
-- SOPA PDFs list *all* projects for the forest’s administrative unit; delineations
-  between projects aren’t always clean in text, so we take a conservative approach.
-- Date parsing accepts both long-form (“Month DD, YYYY”) and month-year (“MM/YYYY”)
-  and we pick reasonable defaults when we only have a single date.
+- SOPA PDFs list *all* projects for the forest’s administrative unit; we split entries
+  on the "Location:" line that closes each one, which works for the standard layout
+  but can still merge entries when text extraction drops that line.
+- Date parsing (shared with the BLM scraper via date_extract.py) accepts long-form
+  (“Month DD, YYYY”), numeric (“MM/DD/YYYY”) and month-year (“MM/YYYY”), and we pick reasonable defaults when we only have a single date.
 - We default state to “Colorado” because this script is scoped to CO forests.
 - If we can’t resolve a precise project name/ID from a row, we still log
   something useful (with confidence and a snippet) rather than dropping it.
@@ -23,17 +35,28 @@ Known rough edges (tracked in README):
 - HTML rows occasionally omit a direct “project=” link; we fall back to “unknown”.
 """
 
+import io
 import os
 import re
 import csv
-import time
-import requests
+import json
+import hashlib
+import multiprocessing
 import tempfile
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from pathlib import Path
 from PyPDF2 import PdfReader
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:  # imported as part of the scripts package (e.g. from tests)
+    from .date_extract import LONG, find_dates
+    from .http_cache import HostRateLimiter, cached_get, default_cache
+except ImportError:  # run directly as `python scripts/<name>.py`
+    from date_extract import LONG, find_dates
+    from http_cache import HostRateLimiter, cached_get, default_cache
 
 # Colorado forests we care about (name, forest_id).
 # Forest IDs map directly to the SOPA report URLs below.
@@ -51,10 +74,112 @@ FORESTS_CO = [
     ("Pawnee National Grassland", "110902"),
 ]
 
-# These are “current month” style links. Pinning to a specific cycle keeps the run reproducible.
-#  Todo: Make the month dynamic
-SOPA_HTML = "https://www.fs.usda.gov/sopa/components/reports/sopa-{forest_id}-2025-07.html"
-SOPA_PDF  = "https://www.fs.usda.gov/sopa/components/reports/sopa-{forest_id}-2025-07.pdf"
+# Monthly report links; {cycle} is "YYYY-MM". By default we probe for the newest published
+# cycle per forest; pass --cycle to pin one for a reproducible run.
+SOPA_HTML = "https://www.fs.usda.gov/sopa/components/reports/sopa-{forest_id}-{cycle}.html"
+SOPA_PDF  = "https://www.fs.usda.gov/sopa/components/reports/sopa-{forest_id}-{cycle}.pdf"
+
+# How many months back from today we probe when looking for the newest cycle.
+CYCLE_LOOKBACK = 3
+PROBE_TIMEOUT = 20
+# Every real HTML report carries this title; the host answers 200 for missing months too.
+SOPA_MARKER = "Schedule of Proposed Actions"
+_SOPA_URL_RE = re.compile(r"sopa-(\d+)-(\d{4}-\d{2})\.(html|pdf)$")
+
+# Fetch scheduling: parallel workers, and the per-host budget they share.
+MAX_WORKERS = 8
+HOST_RATE = 2.0    # requests per second per host
+HOST_BURST = 2     # back-to-back requests allowed before throttling kicks in
+
+# HTML parsing: "lxml" (XPath prefilter, default) or "bs4" (pure-Python fallback).
+HTML_PARSER = "lxml"
+NOTICE_PHRASE = "comment period public notice"
+# Deliberately loose: any text node mentioning "notice". string(.) would glue adjacent
+# cells/<br> pieces together ("PeriodPublic"), so the exact phrase is confirmed in Python
+# on space-joined text, the same way the bs4 path sees it.
+_NOTICE_ROWS_XPATH = (
+    "//tr[count(.//td) >= 2][.//text()[contains(translate(.,"
+    " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'notice')]]"
+)
+
+# PDF text extraction: process-pool size and the per-page text cache (with its size budget).
+PDF_WORKERS = os.cpu_count() or 1
+PDF_TEXT_CACHE_DIR = "data/cache/pdf_text"
+PDF_TEXT_CACHE_MAX_BYTES = 256 * 1024 ** 2
+
+# SOPA PDF layout: every project entry ends with a "Location: UNIT - ... STATE - ..." line
+# (occasionally wrapped onto "COUNTY - ..." / "LEGAL - ..." lines). Page furniture (report
+# title, reporting window, forest name, column headers) repeats on every page, and section
+# headings sit between entries; both are dropped before segmenting so a block starts at
+# its project title.
+_PDF_LOCATION_RE = re.compile(r"^Location:", re.IGNORECASE)
+_PDF_LOCATION_CONT_RE = re.compile(r"^(?:UNIT|STATE|COUNTY|LEGAL)\s*-")
+_PDF_BOILERPLATE_RE = re.compile(
+    r"^(?:Schedule of Proposed Actions|Page \d+ of \d+|(?:Expected\s+)?Project Name\s+Project Purpose"
+    r"|Planning Status\s+Decision|Implementation\s+Project Contact$|Expected$"
+    r"|This report contains the best available information|Questions may be directed"
+    r"|\d{2}/\d{2}/\d{4}(?:\s+to\s+\d{2}/\d{2}/\d{4})?$)",
+    re.IGNORECASE,
+)
+_PDF_FOREST = r"(?:(?:[A-Z][\w.'-]*|and|&)\s+)+(?:National (?:Forests?|Grasslands?)|NFs?|NGs?)"
+_PDF_HEADING_RE = re.compile(
+    r"^(?:Projects Occurring\b.*"                    # "Projects Occurring Nationwide"
+    r"|R\d+\s*-\s*.*\bRegion\b.*"                    # "R2 - Rocky Mountain Region, ..."
+    r"|.*\(excluding\b.*\)"                          # "... (excluding Forest-wide)"
+    r"|(?:[A-Z][\w.'-]*\s+)+Ranger District"          # "Salida Ranger District"
+    r"|" + _PDF_FOREST + r"(?:\s+(?:and|&)\s+" + _PDF_FOREST + r")*(?:,.*)?"  # forest title/heading
+    r")$"
+)
+_PDF_UNIT_RE = re.compile(r"UNIT\s*-\s*(.+?)(?:\.\s+[A-Z]+\s*-|\.?$)")
+_PROJECT_ID_RE = re.compile(r"project=(\d+)")
+
+
+def shift_cycle(cycle, months):
+    """
+    Move a "YYYY-MM" cycle by `months` (negative = earlier).
+    """
+    year, month = map(int, cycle.split("-"))
+    idx = year * 12 + (month - 1) + months
+    return f"{idx // 12:04d}-{idx % 12 + 1:02d}"
+
+
+def resolve_latest_cycle(forest_id, limiter=None, lookback=CYCLE_LOOKBACK):
+    """
+    Find the newest SOPA cycle published for a forest.
+
+    Probes this month's HTML report, then earlier months, and returns the first one that
+    really exists. A cheap HEAD weeds out hard misses; since the host also answers 200
+    (or redirects) for months that aren't published, a candidate only counts if it
+    didn't redirect elsewhere, is HTML, and its body is an actual SOPA report. That body
+    check goes through the shared cache, so parse_html_report() reuses the download.
+
+    Returns:
+        str | None: "YYYY-MM", or None if nothing in the lookback window answered.
+    """
+    session = default_cache().session
+    current = datetime.today().strftime("%Y-%m")
+    for back in range(lookback + 1):
+        cycle = shift_cycle(current, -back)
+        url = SOPA_HTML.format(forest_id=forest_id, cycle=cycle)
+        if limiter:
+            limiter.wait(url)
+        try:
+            r = session.head(url, timeout=PROBE_TIMEOUT, allow_redirects=True)
+        except Exception as e:
+            print(f"[WARN] Probe failed for {url}: {e}")
+            continue
+        if r.status_code != 200 or not r.url.endswith(url.rsplit("/", 1)[-1]):
+            continue
+        if "html" not in r.headers.get("Content-Type", "html").lower():
+            continue
+        try:
+            page = cached_get(url, limiter=limiter, ttl=0, timeout=PROBE_TIMEOUT)
+        except Exception as e:
+            print(f"[WARN] Probe failed for {url}: {e}")
+            continue
+        if page.status_code == 200 and SOPA_MARKER in page.text:
+            return cycle
+    return None
 
 
 def extract_date_range(text):
@@ -63,7 +188,9 @@ def extract_date_range(text):
 
     How we think about dates:
     - Long dates like "July 15, 2025" are ideal.
-    - We also accept "07/2025" as a coarse month-level signal (we treat it as the 1st).
+    - "07/15/2025" works too, and "07/2025" counts as a coarse month-level signal
+      (we treat it as the 1st).
+    - All dates come from one pass of the shared extractor (date_extract.find_dates).
     - If we only see one date:
         * If it’s in the past: interpret as comment_end.
         * If it’s in the future: interpret as comment_start.
@@ -76,45 +203,20 @@ def extract_date_range(text):
         (start_date, comment_start, comment_end, expected_comment_start, expected_comment_end)
         All values are ISO ("YYYY-MM-DD") or None if unknown.
     """
-    date_regex  = r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}"
-    short_regex = r"\b(?:0[1-9]|1[0-2])/\d{4}\b"
-
-    long_dates = re.findall(date_regex, text)
-    short_dates = re.findall(short_regex, text)
-
-    parsed_dates = []
+    matches = find_dates(text)
     today = datetime.today().date()
 
-    # Parse long-form dates first.
-    for d in long_dates:
-        try:
-            parsed = datetime.strptime(d, "%B %d, %Y").date()
-            parsed_dates.append(parsed)
-        except Exception:
-            continue
-
-    # Parse month/year dates (we anchor to day=1).
-    for d in short_dates:
-        try:
-            parsed = datetime.strptime(d, "%m/%Y").date().replace(day=1)
-            parsed_dates.append(parsed)
-        except Exception:
-            continue
-
     # Deduplicate + sort to make reasoning simpler.
-    parsed_dates = sorted(set(parsed_dates))
+    parsed_dates = sorted({m.date for m in matches})
 
     comment_start = comment_end = expected_start = expected_end = None
 
     # If the row explicitly looks like a public notice, assume a 30-day expectation window.
     if "Comment Period Public Notice" in text:
-        notice_match = re.search(date_regex, text)
-        if notice_match:
-            try:
-                expected_start = datetime.strptime(notice_match.group(), "%B %d, %Y").date()
-                expected_end = expected_start + timedelta(days=30)
-            except Exception:
-                pass
+        notice = next((m for m in matches if m.kind == LONG), None)
+        if notice:
+            expected_start = notice.date
+            expected_end = expected_start + timedelta(days=30)
 
     # If we got actual parsed dates, pick the first two as start/end where possible.
     if parsed_dates:
@@ -139,180 +241,455 @@ def extract_date_range(text):
     )
 
 
-def parse_html_report(forest_id, debug=False):
+def _iter_notice_rows_lxml(html_bytes):
+    """
+    Yield (row_text, first_cell_text, first_href) for notice rows, using lxml + XPath.
+
+    The XPath prefilter runs inside libxml2, so Python only touches the few rows that
+    mention a notice at all; the full phrase is then checked on space-joined text.
+    """
+    doc = lxml_html.fromstring(html_bytes)
+    for row in doc.xpath(_NOTICE_ROWS_XPATH):
+        cells = row.xpath(".//td")
+        text = " ".join(t.strip() for t in row.itertext() if t.strip())
+        if NOTICE_PHRASE not in " ".join(text.split()).lower():
+            continue
+        name = "".join(t.strip() for t in cells[0].itertext())
+        hrefs = row.xpath("(.//a)[1]/@href")
+        yield text, name, (hrefs[0] if hrefs else "")
+
+
+def _iter_notice_rows_bs4(html_text, debug=False):
+    """
+    Same contract as _iter_notice_rows_lxml(), via BeautifulSoup's pure-Python parser.
+    """
+    soup = BeautifulSoup(html_text, "html.parser")
+    for row in soup.select("tr"):
+        cells = row.find_all("td")
+        if not cells or len(cells) < 2:
+            continue
+
+        # Flatten row text to make keyword tests easier.
+        text = row.get_text(separator=" ", strip=True)
+        if debug:
+            print(f"[DEBUG] HTML row text: {text.lower()}")
+
+        if NOTICE_PHRASE in " ".join(text.split()).lower():
+            href = row.find("a")
+            yield text, cells[0].get_text(strip=True), (href.get("href", "") if href else "")
+
+
+def parse_html_report(forest_id, cycle, debug=False, limiter=None, parser=HTML_PARSER, archived=False):
     """
     Download and parse the SOPA HTML report for a given forest.
 
     Strategy:
     - Fetch the HTML report for this forest_id.
-    - Iterate table rows, sniff for "comment period public notice".
+    - Find table rows that mention "comment period public notice" (an lxml XPath
+      prefilter by default; parser="bs4" walks every row with BeautifulSoup instead).
     - Pull a project name from the first cell and try to find a "project=<id>" link.
 
     Args:
         forest_id (str): The numeric forest ID in the SOPA URL.
+        cycle (str): Report month, "YYYY-MM".
         debug (bool): If True, echo raw row text to help with tuning.
+        limiter (HostRateLimiter | None): Shared per-host throttle for network fetches.
+        parser (str): "lxml" (fast) or "bs4".
+        archived (bool): Past cycle — immutable, so cache it forever.
 
     Returns:
         list[dict]: Lightweight project-like records with date fields + notes.
     """
-    url = SOPA_HTML.format(forest_id=forest_id)
+    url = SOPA_HTML.format(forest_id=forest_id, cycle=cycle)
+    cache_opts = {"ttl": None} if archived else {}
     try:
-        r = requests.get(url)
-        if "Schedule of Proposed Actions" not in r.text:
+        r = cached_get(url, limiter=limiter, **cache_opts)
+        if SOPA_MARKER not in r.text:
             print(f"[WARN] No HTML SOPA report found for {forest_id}")
             return []
     except Exception as e:
         print(f"[ERROR] Request failed for {url}: {e}")
         return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
-    projects = []
-
-    for row in soup.select("tr"):
-        cells = row.find_all("td")
-        if not cells or len(cells) < 2:
-            continue
+    if parser == "lxml":
+        rows = _iter_notice_rows_lxml(r.content)
+    else:
+        rows = _iter_notice_rows_bs4(r.text, debug=debug)
 
-        # Flatten row text to make keyword tests easier.
-        text = row.get_text(separator=" ", strip=True)
-        if debug:
+    projects = []
+    for text, name, href in rows:
+        if debug and parser == "lxml":
             print(f"[DEBUG] HTML row text: {text.lower()}")
 
-        if "comment period public notice" in text.lower():
-            start, c_start, c_end, expected_start, expected_end = extract_date_range(text)
-
-            # Try to recover a project ID from any hyperlink in the row.
-            href = row.find("a")
-            project_id = None
-            if href and "project=" in href.get("href", ""):
-                m = re.search(r"project=(\d+)", href["href"])
-                project_id = m.group(1) if m else "unknown"
-
-            # First cell usually contains the project title.
-            name = cells[0].get_text(strip=True) if cells else "unknown"
-
-            projects.append({
-                "project_id": project_id or "unknown",
-                "name": name,
-                "state": "Colorado",
-                "latitude": None,
-                "longitude": None,
-                "start_date": start,
-                "comment_start": c_start,
-                "comment_end": c_end,
-                "expected_comment_start": expected_start,
-                "expected_comment_end": expected_end,
-                "confidence": 0.7,   # HTML rows are usually cleaner than PDF blobs
-                "notes": text,
-                "url": url
-            })
+        start, c_start, c_end, expected_start, expected_end = extract_date_range(text)
+
+        # Try to recover a project ID from the row's first hyperlink.
+        project_id = None
+        if "project=" in href:
+            m = _PROJECT_ID_RE.search(href)
+            project_id = m.group(1) if m else "unknown"
+
+        projects.append({
+            "project_id": project_id or "unknown",
+            "name": name or "unknown",   # first cell usually contains the project title
+            "state": "Colorado",
+            "latitude": None,
+            "longitude": None,
+            "start_date": start,
+            "comment_start": c_start,
+            "comment_end": c_end,
+            "expected_comment_start": expected_start,
+            "expected_comment_end": expected_end,
+            "confidence": 0.7,   # HTML rows are usually cleaner than PDF blobs
+            "notes": text,
+            "url": url
+        })
 
     return projects
 
 
-def download_pdf(forest_id):
+def download_pdf(forest_id, cycle, limiter=None, archived=False):
     """
-    Grab the monthly SOPA PDF for a forest and stash it in a temp folder.
+    Grab the monthly SOPA PDF for a forest as a readable binary stream.
+
+    The body is streamed, never buffered whole and re-written: a cached download is
+    read straight from its cache file, and an uncached one lives in a spooled buffer
+    (memory first, spilling to an anonymous temp file only for very large PDFs).
+    Nothing is written to a shared temp path, so parallel forests can't collide.
 
     Returns:
-        Path | None: Path to the downloaded PDF if it looks valid, else None.
+        BinaryIO | None: Seekable stream positioned at 0 if it looks like a PDF, else None.
+            Callers should close it when done.
     """
-    url = SOPA_PDF.format(forest_id=forest_id)
-    tmpdir = Path(tempfile.gettempdir())
-    pdf_path = tmpdir / f"sopa_{forest_id}.pdf"
+    url = SOPA_PDF.format(forest_id=forest_id, cycle=cycle)
+    cache_opts = {"ttl": None} if archived else {}
 
     try:
-        r = requests.get(url)
-        # Quick sanity checks: status 200 and PDF magic bytes somewhere near the start.
-        if r.status_code != 200 or b"%PDF" not in r.content[:1024]:
+        r = cached_get(url, limiter=limiter, stream=True, **cache_opts)
+        if r.status_code != 200:
             print(f"[WARN] No PDF SOPA report found for {forest_id}")
             return None
 
-        with open(pdf_path, "wb") as f:
-            f.write(r.content)
-        return pdf_path
+        # Quick sanity check: PDF magic bytes somewhere near the start.
+        stream = r.open()
+        if b"%PDF" not in stream.read(1024):
+            stream.close()
+            print(f"[WARN] No PDF SOPA report found for {forest_id}")
+            return None
+        stream.seek(0)
+        return stream
     except Exception as e:
         print(f"[ERROR] Failed to download PDF for {forest_id}: {e}")
         return None
 
 
-def parse_pdf_report(forest_id, pdf_path, debug=False):
+def _extract_pages(pdf_bytes):
     """
-    Do a light pass over the SOPA PDF text and look for "public comment" mentions.
+    Extract the text of every page — runs inside a worker process.
+    """
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def _trim_pdf_text_cache(cache_dir, max_bytes=PDF_TEXT_CACHE_MAX_BYTES):
+    """
+    Delete the least recently used page-text entries until the cache fits in max_bytes.
+    Files that vanish mid-scan (another forest's thread trimming too) are skipped.
+    """
+    entries = []
+    for p in Path(cache_dir).glob("*.json"):
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def extract_pdf_pages(pdf, pool=None, cache_dir=PDF_TEXT_CACHE_DIR):
+    """
+    Per-page text for a PDF, extracted on a process pool and cached by content hash.
+
+    How it works:
+    - Hash the PDF bytes; if we've seen this exact report before, return the cached pages.
+    - Otherwise hand the whole PDF to `pool` as one work item (the bytes cross the
+      process boundary once and are parsed once), or extract in-process if no pool.
+      Parallelism comes from several forests' PDFs being in flight at the same time.
+    - Cache the result, then trim the cache back under PDF_TEXT_CACHE_MAX_BYTES.
+
+    Args:
+        pdf (BinaryIO | bytes): PDF stream or raw bytes.
+        pool (ProcessPoolExecutor | None): Shared worker pool.
+        cache_dir (str | None): Where per-hash page text is cached (None disables it).
+
+    Returns:
+        list[str]: Text of each page, in order.
+    """
+    data = pdf if isinstance(pdf, bytes) else pdf.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    cache_path = Path(cache_dir) / f"{digest}.json" if cache_dir else None
+    if cache_path and cache_path.exists():
+        try:
+            pages = json.loads(cache_path.read_text(encoding="utf-8"))
+            os.utime(cache_path)  # recently used, so trimmed last
+            return pages
+        except (OSError, ValueError):
+            pass
+
+    pages = pool.submit(_extract_pages, data).result() if pool else _extract_pages(data)
+
+    if cache_path:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(pages, f)
+        os.replace(tmp, cache_path)
+        _trim_pdf_text_cache(cache_path.parent)
+
+    return pages
+
+
+def segment_pdf_projects(pages):
+    """
+    Split SOPA PDF page text into per-project blocks, one page at a time.
+
+    A block runs from the line after the previous entry's "Location:" line up to and
+    including this entry's "Location:" line (plus any wrapped UNIT/STATE/COUNTY/LEGAL
+    continuation lines). Page headers/footers and section headings are skipped, so each
+    block starts at its project title, and blocks can span pages.
+
+    Args:
+        pages (Iterable[str]): Page texts in order (consumed lazily).
+
+    Yields:
+        list[str]: Cleaned lines for one project entry.
+    """
+    block = []
+    closing = False
+    for page_text in pages:
+        for line in page_text.splitlines():
+            line = line.strip()
+            if not line or _PDF_BOILERPLATE_RE.match(line) or _PDF_HEADING_RE.match(line):
+                continue
+            if closing:
+                if _PDF_LOCATION_CONT_RE.match(line):
+                    block.append(line)
+                    continue
+                yield block
+                block, closing = [], False
+            block.append(line)
+            if _PDF_LOCATION_RE.match(line):
+                closing = True
+    if block:
+        yield block
+
+
+def _pdf_block_record(url, lines):
+    """
+    Build a CSV record from one project block, or None if it has no comment language.
+    """
+    text = " ".join(lines)
+    lowered = text.lower()
+    if "public comment" not in lowered and "comment period" not in lowered:
+        return None
+
+    start, c_start, c_end, expected_start, expected_end = extract_date_range(text)
+
+    # Title is the start of the first line (the purpose column often follows after " - ").
+    name = lines[0].split(" - ")[0].strip() or "unknown"
+    m = _PROJECT_ID_RE.search(text)
+    unit = _PDF_UNIT_RE.search(text)
+
+    return {
+        "project_id": m.group(1) if m else "unknown",
+        "name": name,
+        "unit": unit.group(1).strip() if unit else None,
+        "state": "Colorado",
+        "latitude": None,
+        "longitude": None,
+        "start_date": start,
+        "comment_start": c_start,
+        "comment_end": c_end,
+        "expected_comment_start": expected_start,
+        "expected_comment_end": expected_end,
+        "confidence": 0.6,   # PDF text is noisier than HTML rows
+        "notes": text[:500],  # short per-project snippet for manual QA
+        "url": url
+    }
+
+
+def parse_pdf_report(forest_id, pdf, debug=False, pool=None, cycle=None):
+    """
+    Segment the SOPA PDF into per-project entries and keep those with public comment language.
+
+    Args:
+        forest_id (str): The numeric forest ID in the SOPA URL.
+        pdf (BinaryIO | str | Path): Stream from download_pdf(), or a local PDF path.
+        debug (bool): If True, echo each kept block's name.
+        pool (ProcessPoolExecutor | None): Worker pool for page extraction.
+        cycle (str | None): Report month "YYYY-MM" (used for the record URL).
 
     Caveat:
-    - The PDF aggregates many projects; text extraction sometimes smashes boundaries.
-      We record what we can with a short snippet and conservative confidence.
+    - Text extraction sometimes drops or reorders lines, so a block can occasionally
+      swallow its neighbor; records keep a conservative confidence.
 
     Returns:
-        list[dict]: PDF-derived “maybe projects” with expected/actual date hints.
+        list[dict]: One record per PDF project entry, each with its own date hints.
     """
+    if cycle:
+        url = SOPA_PDF.format(forest_id=forest_id, cycle=cycle)
+    else:
+        url = str(pdf) if isinstance(pdf, (str, Path)) else ""
     projects = []
     try:
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"{pdf_path} does not exist")
-
-        reader = PdfReader(str(pdf_path))
-        text = "\n".join(page.extract_text() or "" for page in reader.pages)
-
-        if "public comment" in text.lower():
-            start, c_start, c_end, expected_start, expected_end = extract_date_range(text)
-
-            # Keep a small snippet anchored around the first “public comment” we saw.
-            # This helps with manual QA without dumping the whole PDF into the CSV.
-            idx = text.lower().find("public comment")
-            snippet = text[idx:][:500] if idx >= 0 else text[:500]
-
-            projects.append({
-                "project_id": "unknown",
-                "name": "unknown",
-                "state": "Colorado",
-                "latitude": None,
-                "longitude": None,
-                "start_date": start,
-                "comment_start": c_start,
-                "comment_end": c_end,
-                "expected_comment_start": expected_start,
-                "expected_comment_end": expected_end,
-                "confidence": 0.6,   # PDF text is noisier than HTML rows
-                "notes": snippet,
-                "url": str(pdf_path)
-            })
+        if isinstance(pdf, (str, Path)):
+            if not Path(pdf).exists():
+                raise FileNotFoundError(f"{pdf} does not exist")
+            pdf = Path(pdf).read_bytes()
+
+        pages = extract_pdf_pages(pdf, pool=pool)
+        for lines in segment_pdf_projects(pages):
+            record = _pdf_block_record(url, lines)
+            if record:
+                if debug:
+                    print(f"[DEBUG] PDF project block: {record['name']}")
+                projects.append(record)
     except Exception as e:
         print(f"[ERROR] PDF parse failed for {forest_id}: {e}")
 
     return projects
 
 
-def run_scraper(debug_html=False):
+def _scrape_pdf(forest_id, cycle, debug=False, limiter=None, pool=None, archived=False):
+    """
+    Download + parse one forest's PDF (one unit of work for the scheduler).
+    """
+    pdf = download_pdf(forest_id, cycle, limiter=limiter, archived=archived)
+    if not pdf:
+        return []
+    with pdf:
+        return parse_pdf_report(forest_id, pdf, debug=debug, pool=pool, cycle=cycle)
+
+
+def _dedupe_key(rec):
+    """
+    (key, cycle) for cross-cycle de-duplication, or (None, None) if the record can't be
+    identified safely (no SOPA URL, or only the "unknown" placeholder for id and name).
+    """
+    m = _SOPA_URL_RE.search(rec.get("url") or "")
+    if not m:
+        return None, None
+    forest_id, cycle, ext = m.groups()
+    pid = rec.get("project_id")
+    name = (rec.get("name") or "").strip().lower()
+    ident = pid if pid and pid != "unknown" else (name if name and name != "unknown" else None)
+    if ident is None:
+        return None, None
+    return (forest_id, ext, ident), cycle
+
+
+def dedupe_records(records):
+    """
+    Drop repeats of the same project seen in an older cycle of the same forest.
+
+    Records arrive newest cycle first, so the freshest copy is kept. Keys include the
+    forest and report type (HTML vs PDF), and only repeats from a *different* cycle are
+    dropped, so same-named projects in other forests, or twice in one report, all
+    survive. Records we can't identify (id and name both "unknown") are always kept.
+    """
+    first_cycle = {}
+    unique = []
+    for rec in records:
+        key, cycle = _dedupe_key(rec)
+        if key is not None and first_cycle.setdefault(key, cycle) != cycle:
+            continue
+        unique.append(rec)
+    return unique
+
+
+def run_scraper(debug_html=False, max_workers=MAX_WORKERS, rate=HOST_RATE, pdf_workers=PDF_WORKERS,
+                html_parser=HTML_PARSER, cycle=None, backfill=0):
     """
     Drive the whole SOPA collection flow:
     - For each forest: parse HTML rows, then try the PDF as a backstop.
-    - Sleep briefly between forests to be polite.
+    - Every forest's HTML and PDF job runs concurrently on a thread pool, so network
+      waits overlap with parsing; a shared per-host token bucket keeps us polite.
+    - PDF page text is extracted on one shared process pool (pdf_workers processes).
+    - Each forest's newest cycle is probed (unless `cycle` pins one), plus `backfill`
+      earlier months; projects repeated across cycles are collapsed to the newest.
 
     Args:
         debug_html (bool): Echo row text during HTML parse if True.
+        max_workers (int): Thread pool size.
+        rate (float): Requests per second per host (0 = unlimited).
+        pdf_workers (int): Processes for PDF text extraction (<= 1 extracts in-process).
+        html_parser (str): "lxml" or "bs4" for the HTML reports.
+        cycle (str | None): Pin every forest to this "YYYY-MM" cycle instead of probing.
+        backfill (int): Extra prior months to scrape per forest.
 
     Returns:
-        list[dict]: All harvested records across forests.
+        list[dict]: All harvested records across forests (FORESTS_CO order, newest cycle
+        first, HTML before PDF).
     """
-    all_records = []
-
-    for name, forest_id in FORESTS_CO:
-        print(f"[INFO] Scraping forest: {name}")
+    limiter = HostRateLimiter(rate, burst=HOST_BURST)
+    # "spawn", not the POSIX default fork: workers start while our HTTP threads are
+    # running, and forking a multithreaded process can deadlock.
+    pdf_pool = (ProcessPoolExecutor(max_workers=pdf_workers, mp_context=multiprocessing.get_context("spawn"))
+                if pdf_workers > 1 else None)
 
-        # 1) HTML report (usually the cleanest signals)
-        html_records = parse_html_report(forest_id, debug=debug_html)
-        all_records.extend(html_records)
+    try:
+        all_records = _run_jobs(debug_html, max_workers, limiter, pdf_pool, html_parser, cycle, backfill)
+    finally:
+        if pdf_pool:
+            pdf_pool.shutdown()
+    # Only backfilled runs can see the same project in more than one cycle.
+    return dedupe_records(all_records) if backfill else all_records
 
-        # Small pause between requests so we’re good citizens.
-        time.sleep(1)
 
-        # 2) Monthly PDF (catch-all)
-        pdf_path = download_pdf(forest_id)
-        if pdf_path:
-            pdf_records = parse_pdf_report(forest_id, pdf_path, debug=debug_html)
-            all_records.extend(pdf_records)
+def _run_jobs(debug_html, max_workers, limiter, pdf_pool, html_parser, cycle, backfill):
+    """
+    Fan every forest/cycle HTML + PDF job out on a thread pool and gather results in order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        forest_ids = [forest_id for _, forest_id in FORESTS_CO]
+        if cycle:
+            latest = dict.fromkeys(forest_ids, cycle)
+        else:
+            latest = dict(zip(forest_ids, pool.map(lambda fid: resolve_latest_cycle(fid, limiter), forest_ids)))
+
+        jobs = []
+        for name, forest_id in FORESTS_CO:
+            if not latest[forest_id]:
+                print(f"[WARN] No recent SOPA cycle found for {name}")
+                continue
+            for back in range(backfill + 1):
+                cyc = shift_cycle(latest[forest_id], -back)
+                archived = back > 0
+                print(f"[INFO] Scraping forest: {name} ({cyc})")
+                # 1) HTML report (usually the cleanest signals)
+                html_job = pool.submit(parse_html_report, forest_id, cyc, debug=debug_html,
+                                       limiter=limiter, parser=html_parser, archived=archived)
+                # 2) Monthly PDF (catch-all)
+                pdf_job = pool.submit(_scrape_pdf, forest_id, cyc, debug=debug_html, limiter=limiter,
+                                      pool=pdf_pool, archived=archived)
+                jobs.append((name, html_job, pdf_job))
+
+        all_records = []
+        for name, html_job, pdf_job in jobs:
+            for job in (html_job, pdf_job):
+                try:
+                    all_records.extend(job.result())
+                except Exception as e:
+                    print(f"[ERROR] Forest {name} failed: {e}")
 
     return all_records
 
@@ -322,7 +699,7 @@ def save_to_csv(records, path="data/interim/usfs_public_comment.csv"):
     Write everything to a consistent CSV so downstream steps don’t have to guess.
 
     Columns:
-        project_id, name, state, latitude, longitude,
+        project_id, name, unit, state, latitude, longitude,
         start_date, comment_start, comment_end,
         expected_comment_start, expected_comment_end,
         confidence, notes, url
@@ -330,7 +707,7 @@ def save_to_csv(records, path="data/interim/usfs_public_comment.csv"):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=[
-            "project_id", "name", "state", "latitude", "longitude",
+            "project_id", "name", "unit", "state", "latitude", "longitude",
             "start_date", "comment_start", "comment_end",
             "expected_comment_start", "expected_comment_end",
             "confidence", "notes", "url"
@@ -345,10 +722,24 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug-html", action="store_true",
                         help="Print raw HTML row text and PDF snippets for debugging")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help="Number of forest reports fetched/parsed at once")
+    parser.add_argument("--rate", type=float, default=HOST_RATE,
+                        help="Max requests per second per host (0 = unlimited)")
+    parser.add_argument("--pdf-workers", type=int, default=PDF_WORKERS,
+                        help="Processes for PDF text extraction (1 = extract in-process)")
+    parser.add_argument("--html-parser", choices=["lxml", "bs4"], default=HTML_PARSER,
+                        help="HTML report parser (lxml with XPath prefilter, or BeautifulSoup)")
+    parser.add_argument("--cycle", default=None, metavar="YYYY-MM",
+                        help="Pin the SOPA cycle instead of probing for the newest one")
+    parser.add_argument("--backfill", type=int, default=0,
+                        help="Also scrape this many months before the newest cycle")
     args = parser.parse_args()
 
     # 1) Collect records across all CO forests.
-    records = run_scraper(debug_html=args.debug_html)
+    records = run_scraper(debug_html=args.debug_html, max_workers=args.workers, rate=args.rate,
+                          pdf_workers=args.pdf_workers, html_parser=args.html_parser,
+                          cycle=args.cycle, backfill=args.backfill)
 
     # 2) Save the lot to a predictable path for the rest of the pipeline.
     save_to_csv(records)
@@ -0,0 +1,17 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from scripts import http_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """
+    Point the process-wide HTTP cache at a throwaway directory for each test.
+    """
+    cache = http_cache.HttpCache(cache_dir=tmp_path / "http", session=http_cache.make_session(retries=0))
+    monkeypatch.setattr(http_cache, "_default_cache", cache)
+    return cache
@@ -0,0 +1,82 @@
+"""
+BLM ePlanning JSON API engine, replayed against recorded fixtures with requests-mock.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from scripts import blm_scrape
+from scripts.blm_scrape import (API_PROJECT_URL, API_SEARCH_URL, ARCGIS_LAYER, _json_to_text,
+                                build_record, discover_listings_api, scrape_projects_api)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "eplanning"
+
+
+def _load(name):
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def eplanning(requests_mock):
+    """
+    Serve the recorded search, project-detail and ArcGIS responses.
+    """
+    requests_mock.post(API_SEARCH_URL, json=_load("search_page0.json"))
+    for path in FIXTURES.glob("project_*.json"):
+        pid = re.search(r"project_(\d+)", path.name).group(1)
+        requests_mock.get(API_PROJECT_URL.format(pid=pid), json=_load(path.name))
+    requests_mock.get(API_PROJECT_URL.format(pid="2030004"), status_code=404)
+    requests_mock.get(ARCGIS_LAYER, json={"maxRecordCount": 2000})
+    requests_mock.post(f"{ARCGIS_LAYER}/query", json=_load("arcgis_query.json"))
+    return requests_mock
+
+
+def test_discover_listings_api_collects_numeric_ids(eplanning):
+    listings = discover_listings_api()
+    assert sorted(listings) == ["2030001", "2030002", "2030003", "2030004"]
+    assert eplanning.request_history[0].json()["states"] == ["CO"]
+
+
+def test_scrape_projects_api_hits_misses_and_unresolved(eplanning):
+    ids = ["2030001", "2030002", "2030003", "2030004"]
+    fingerprints = {}
+    records, unresolved = scrape_projects_api(ids, fingerprints=fingerprints)
+
+    by_id = {rec["project_id"]: rec for rec in records}
+    assert sorted(by_id) == ["2030001", "2030003"]
+    assert unresolved == ["2030004"]
+    assert sorted(fingerprints) == ["2030001", "2030002", "2030003"]
+
+    assert by_id["2030001"]["start_date"] == "2025-08-04"
+    assert (by_id["2030001"]["latitude"], by_id["2030001"]["longitude"]) == (39.06, -108.55)
+    assert by_id["2030003"]["start_date"] == "2025-09-02"
+
+
+def test_comment_field_names_alone_are_not_a_hit():
+    text = _json_to_text({"publicCommentPeriod": False, "publicCommentStartDate": None,
+                          "publicCommentEndDate": "", "publicCommentNotes": "n/a"})
+    assert build_record("1", text) is None
+
+
+def test_comment_date_fields_count_as_a_hit():
+    text = _json_to_text({"publicCommentEndDate": "2025-10-02T06:00:00.000+0000"})
+    record = build_record("1", text)
+    assert record and record["start_date"] == "2025-10-02"
+
+
+def test_api_engine_falls_back_to_browser_for_unresolved(eplanning, monkeypatch, tmp_path):
+    browser_calls = []
+
+    def fake_browser(ids, **kwargs):
+        browser_calls.append(list(ids))
+        kwargs["fingerprints"].update({pid: "browser" for pid in ids})
+        return []
+
+    monkeypatch.setattr(blm_scrape, "scrape_projects", fake_browser)
+    records = blm_scrape.crawl(engine="api", state_path=str(tmp_path / "state.json"),
+                               journal_path=str(tmp_path / "journal.jsonl"))
+    assert browser_calls == [["2030004"]]
+    assert [rec["project_id"] for rec in records] == ["2030001", "2030003"]
@@ -0,0 +1,48 @@
+"""
+Fuzzy district matching scores the distinctive words, not the shared suffix, and
+units that match nothing still count against the row's score.
+"""
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from scripts.enrich_with_district_geoms import build_fuzzy_index, compute_centroids_csv, fuzzy_match_unit
+
+INDEX = {key: ((key.title(),), ()) for key in (
+    "tampa ranger district",
+    "pikes peak ranger district",
+    "sulphur ranger district",
+)}
+
+
+def test_one_letter_different_district_is_not_matched():
+    fuzzy_index = build_fuzzy_index(INDEX)
+    assert fuzzy_match_unit("Yampa Ranger District", fuzzy_index) == (None, None)
+
+
+def test_punctuation_variant_still_matches():
+    fuzzy_index = build_fuzzy_index(INDEX)
+    key, score = fuzzy_match_unit("Pike's Peak Ranger District", fuzzy_index)
+    assert key == "pikes peak ranger district"
+    assert 88 <= score < 100
+
+
+def test_generic_suffix_does_not_inflate_the_score():
+    fuzzy_index = build_fuzzy_index(INDEX)
+    assert fuzzy_match_unit("Yampa Ranger District", fuzzy_index, score_cutoff=0) == ("tampa ranger district", 80.0)
+
+
+def test_partial_miss_is_not_scored_as_exact(tmp_path):
+    box = shapely.box(0, 0, 2, 2)
+    districts = gpd.GeoDataFrame({"unit_name": ["Sulphur Ranger District"],
+                                  "unit_lc": ["sulphur ranger district"]}, geometry=[box], crs=4326)
+    csv = tmp_path / "usfs.csv"
+    pd.DataFrame({"unit": ["Sulphur Ranger District, Nowhere Ranger District",
+                           "Sulphur Ranger District", None]}).to_csv(csv, index=False)
+
+    out = compute_centroids_csv(str(csv), districts)
+    assert list(out["match_score"][:2]) == [0.0, 100.0]
+    assert pd.isna(out["match_score"][2])
+    assert list(out["unmatched_units"]) == [1, 0, 0]
+    assert list(out["longitude"][:2]) == [1.0, 1.0]
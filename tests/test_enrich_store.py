@@ -0,0 +1,30 @@
+"""
+District store rebuilds download the layer fresh, never from the HTTP cache.
+"""
+
+from scripts.enrich_with_district_geoms import LAYER_BASE, load_ranger_districts
+
+INFO = {"maxRecordCount": 1000, "supportsPagination": True, "fields": [{"name": "DISTRICTNAME"}]}
+
+
+def _page(name):
+    return {"type": "FeatureCollection", "features": [{
+        "type": "Feature",
+        "properties": {"DISTRICTNAME": name},
+        "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+    }]}
+
+
+def test_refresh_rebuilds_store_from_the_network(tmp_path, requests_mock, isolated_http_cache):
+    store = tmp_path / "districts.fgb"
+    requests_mock.get(LAYER_BASE, json=INFO)
+    requests_mock.get(f"{LAYER_BASE}/query", json=_page("Old Ranger District"))
+    assert list(load_ranger_districts(store)["unit_name"]) == ["Old Ranger District"]
+    assert store.is_file()
+
+    requests_mock.get(f"{LAYER_BASE}/query", json=_page("New Ranger District"))
+    assert list(load_ranger_districts(store, refresh=True)["unit_name"]) == ["New Ranger District"]
+    assert list(load_ranger_districts(store)["unit_name"]) == ["New Ranger District"]
+
+    cached_urls = {p.read_text() for p in isolated_http_cache.dir.glob("*/*.json")}
+    assert not any("/query" in meta for meta in cached_urls)
@@ -0,0 +1,18 @@
+"""
+HttpCache eviction never takes away the body it is about to return.
+"""
+
+from scripts.http_cache import HttpCache, make_session
+
+URL = "https://example.org/big.pdf"
+
+
+def test_oversized_body_is_still_served(tmp_path, requests_mock):
+    requests_mock.get("https://example.org/old", content=b"old")
+    requests_mock.get(URL, content=b"thirteen byte")
+    cache = HttpCache(cache_dir=tmp_path, max_bytes=10, session=make_session(retries=0))
+
+    cache.get("https://example.org/old")
+    r = cache.get(URL)
+    assert r.content == b"thirteen byte"
+    assert [p.read_bytes() for p in tmp_path.glob("*/*.body")] == [b"thirteen byte"]
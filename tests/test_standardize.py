@@ -0,0 +1,115 @@
+"""
+standardize.py: column-wise mapping and the streaming writers.
+"""
+
+import json
+import os
+import stat
+
+import pandas as pd
+import pytest
+
+from scripts import standardize
+from scripts.standardize import (CsvWriter, GeoJSONWriter, map_rows_to_final, to_iso,
+                                 to_iso_series, to_iso_stats)
+
+ROW = {"project_name": "A", "source": "BLM", "start_date": "2025-07-15", "end_date": "",
+       "notes": "", "longitude": -105.5, "latitude": 39.1}
+
+
+@pytest.mark.parametrize("fmt", ["collection", "seq"])
+def test_geojson_writer_round_trips(tmp_path, fmt):
+    path = tmp_path / "out.geojson"
+    with GeoJSONWriter(str(path), fmt) as out:
+        out.write_rows([ROW, ROW])
+    text = path.read_text(encoding="utf-8")
+    feats = json.loads(text)["features"] if fmt == "collection" else [json.loads(l) for l in text.splitlines()]
+    assert [f["geometry"]["coordinates"] for f in feats] == [[-105.5, 39.1]] * 2
+    assert ", " not in text  # compact separators
+
+
+def test_failed_run_leaves_previous_outputs_alone(tmp_path):
+    gj, csv_path = tmp_path / "out.geojson", tmp_path / "out.csv"
+    gj.write_text("previous", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with CsvWriter(str(csv_path)) as c, GeoJSONWriter(str(gj)) as g:
+            c.write_rows([ROW])
+            g.write_rows([ROW])
+            raise RuntimeError("mapper blew up")
+    assert gj.read_text(encoding="utf-8") == "previous"
+    assert not csv_path.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.geojson"]
+
+
+def test_map_rows_to_final_blm_reprojects_and_drops_unlocated():
+    df = pd.DataFrame({
+        "project_id": ["2030001", "2030002", "2030003"],
+        "state": ["Colorado"] * 3,
+        "latitude": ["39.06", "4721671.57", ""],
+        "longitude": ["-108.55", "-11804376.0", ""],
+        "comment_start": ["07/15/2025", "2025-08-01", ""],
+        "url": ["https://eplanning.blm.gov/eplanning-ui/project/2030001/510"] * 3,
+    })
+    rows = map_rows_to_final(df)
+    assert [r["project_name"] for r in rows] == ["2030001", "2030002"]
+    assert rows[0]["start_date"] == "2025-07-15" and rows[1]["start_date"] == "2025-08-01"
+    assert rows[1]["longitude"] == pytest.approx(-106.04, abs=0.01)
+    assert rows[1]["latitude"] == pytest.approx(39.0, abs=0.1)
+
+
+def test_map_rows_to_final_usfs_names_and_dates():
+    df = pd.DataFrame({
+        "name": ["Monarch Trail Reroute.", ""],
+        "unit": ["Salida Ranger District", "Leadville Ranger District"],
+        "comment_start": ["July 21, 2025", ""],
+        "expected_comment_start": ["", "2025-09-02"],
+        "longitude": ["-106.3", "-106.2"],
+        "latitude": ["38.5", "39.2"],
+    }).fillna("")
+    rows = map_rows_to_final(df)
+    assert [r["project_name"] for r in rows] == ["Monarch Trail Reroute", "Unnamed project"]
+    assert [r["start_date"] for r in rows] == ["2025-07-21", "2025-09-02"]
+    assert all(r["source"] == "USFS" for r in rows)
+
+
+def test_to_iso_stats_count_every_value_by_path(monkeypatch):
+    monkeypatch.setattr(standardize, "TO_ISO_COUNTS", standardize.Counter())
+    monkeypatch.setattr(standardize, "TO_ISO_CACHE_HITS", standardize.Counter())
+    monkeypatch.setattr(standardize, "_TO_ISO_MEMO", {})
+
+    col = pd.Series(["2025-07-15", "2025-07-15", "2025-07-15", "7/4/2025", "", "July 4 2025ish", None])
+    assert list(to_iso_series(col)) == ["2025-07-15"] * 3 + ["2025-07-04", "", "", ""]
+    assert to_iso("07/04/2025") == "2025-07-04"
+    assert to_iso("7/4/2025") == "2025-07-04"
+
+    assert to_iso_stats() == {
+        "iso": {"values": 3, "cached": 2},
+        "mdy": {"values": 3, "cached": 1},
+        "unparsed": {"values": 1, "cached": 0},
+        "blank": {"values": 2, "cached": 0},
+    }
+
+
+@pytest.mark.parametrize("value", ["July 15", "March", "15", "1", "Monday", "Feb 29", "2025"])
+def test_to_iso_rejects_dates_without_year_and_month(value):
+    assert to_iso(value) == ""
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("15 July 2025", "2025-07-15"),
+    ("March 2025", "2025-03-01"),
+    ("Tue, 15 Jul 2025 10:00:00 GMT", "2025-07-15"),
+])
+def test_to_iso_dateutil_fallback_keeps_complete_dates(value, expected):
+    assert to_iso(value) == expected
+
+
+def test_outputs_get_normal_file_permissions(tmp_path):
+    old = os.umask(0o022)
+    try:
+        for cls, name in ((CsvWriter, "out.csv"), (GeoJSONWriter, "out.geojson")):
+            with cls(str(tmp_path / name)) as out:
+                out.write_rows([ROW])
+            assert stat.S_IMODE((tmp_path / name).stat().st_mode) == 0o644
+    finally:
+        os.umask(old)
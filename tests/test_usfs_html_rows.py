@@ -0,0 +1,24 @@
+"""
+The lxml (XPath prefilter) and bs4 HTML row parsers must keep the same notice rows.
+"""
+
+from scripts.usfs_sopa_scrape import _iter_notice_rows_bs4, _iter_notice_rows_lxml
+
+HTML = """<html><body><table>
+<tr><td>Header</td><td>Status</td></tr>
+<tr><td><a href="/project/?project=11111">Plain Row</a></td><td>Comment Period Public Notice 07/21/2025</td></tr>
+<tr><td><a href="/project/?project=22222">Split Cells</a></td><td>Comment Period</td><td>Public Notice</td></tr>
+<tr><td>Line Break</td><td>Comment Period Public<br>Notice August 4, 2025</td></tr>
+<tr><td>Wrapped</td><td>Comment Period
+    Public Notice</td></tr>
+<tr><td>Other Notice</td><td>Legal notice published</td></tr>
+<tr><td>Single cell Comment Period Public Notice</td></tr>
+</table></body></html>"""
+
+
+def test_lxml_and_bs4_keep_the_same_rows():
+    lxml_rows = list(_iter_notice_rows_lxml(HTML.encode("utf-8")))
+    bs4_rows = list(_iter_notice_rows_bs4(HTML))
+    assert [name for _, name, _ in lxml_rows] == ["Plain Row", "Split Cells", "Line Break", "Wrapped"]
+    assert [name for _, name, _ in bs4_rows] == [name for _, name, _ in lxml_rows]
+    assert [href for _, _, href in lxml_rows] == [href for _, _, href in bs4_rows]
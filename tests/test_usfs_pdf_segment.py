@@ -0,0 +1,57 @@
+"""
+SOPA PDF segmentation against a small fixture of extracted page text.
+
+The fixture mimics PyPDF2 output for a two-page report: repeated page headers, the
+reporting-window line, section headings between entries, and one entry that runs
+across the page break.
+"""
+
+from pathlib import Path
+
+from scripts.usfs_sopa_scrape import _pdf_block_record, segment_pdf_projects
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sopa_pdf_pages.txt"
+URL = "https://www.fs.usda.gov/sopa/components/reports/sopa-110208-2025-07.pdf"
+
+
+def _pages():
+    return FIXTURE.read_text(encoding="utf-8").split("\f")
+
+
+def test_blocks_start_at_project_titles():
+    blocks = list(segment_pdf_projects(_pages()))
+    assert [b[0].split(" - ")[0] for b in blocks] == [
+        "Locatable Minerals Rule",
+        "Upper Arkansas Fuels Project",
+        "Monarch Trail Reroute",
+    ]
+
+
+def test_headers_and_headings_are_dropped():
+    text = "\n".join(line for block in segment_pdf_projects(_pages()) for line in block)
+    assert "07/01/2025 to 09/30/2025" not in text
+    assert "National Grasslands" not in text
+    assert "Projects Occurring Nationwide" not in text
+    assert "(excluding Forest-wide)" not in text
+    assert "\nSalida Ranger District\n" not in f"\n{text}\n"
+
+
+def test_block_spans_page_break_and_keeps_wrapped_location():
+    blocks = list(segment_pdf_projects(_pages()))
+    fuels = blocks[1]
+    assert "September 3, 2025. EA" in fuels
+    assert fuels[-1] == "COUNTY - Chaffee, Lake."
+
+
+def test_records_use_project_dates_not_report_window():
+    records = [r for r in (_pdf_block_record(URL, b) for b in segment_pdf_projects(_pages())) if r]
+    by_name = {r["name"]: r for r in records}
+    assert set(by_name) == {"Upper Arkansas Fuels Project", "Monarch Trail Reroute"}
+
+    fuels = by_name["Upper Arkansas Fuels Project"]
+    assert (fuels["comment_start"], fuels["comment_end"]) == ("2025-08-04", "2025-09-03")
+    assert fuels["unit"] == "Leadville Ranger District, Salida Ranger District"
+
+    trail = by_name["Monarch Trail Reroute"]
+    assert "2025-07-01" not in (trail["comment_start"], trail["comment_end"])
+    assert trail["unit"] == "Salida Ranger District"